@@ -1,9 +1,19 @@
 # -*- coding: utf-8 -*-
-from .basic import *
-
 __all__ = [
     'Counter',
     'Logger',
     'MultiTask',
     'MultiTaskVariable',
 ]
+
+
+def __getattr__(name: str):
+    # 延迟导入基础工具，避免仅导入子包时加载 colorama、multiprocessing 等依赖
+    if name in __all__:
+        from . import basic
+        return getattr(basic, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
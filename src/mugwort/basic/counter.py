@@ -40,7 +40,9 @@ class Counter:
         self._title = f'{title:<60}' if title else ''
         self._start_time = time.time()
         self._monotonic_time = time.monotonic()
-        self._printed_value = 0
+        self._next_print = interval
+        self._completion_key: t.Optional[t.Tuple[int, int]] = None
+        self._completion_str = ''
 
     def increase(self, value: int = 1):
         """自增函数，支持链式调用打印函数"""
@@ -49,17 +51,21 @@ class Counter:
 
     def print(self, *, force: bool = False):
         """打印函数"""
-        if force or self.printable:
-            self._printed_value = self._value // self.interval * self.interval
+        if force or self._value >= self._next_print:
+            self._next_print = (self._value // self.interval + 1) * self.interval
             self.logger.info(self)
 
+    def should_print(self) -> bool:
+        """是否达到打印间隔"""
+        return self._value >= self._next_print
+
     @property
     def value(self) -> int:
         return self._value
 
     @property
     def printable(self) -> bool:
-        return self._value - self._printed_value >= self.interval
+        return self._value >= self._next_print
 
     @property
     def progress(self) -> str:
@@ -82,7 +88,19 @@ class Counter:
         completed_time = ((time.monotonic() - self._monotonic_time) * self.total / self._value) + self._start_time
         return datetime.datetime.fromtimestamp(completed_time).strftime('%Y-%m-%d %H:%M:%S')
 
+    def _get_completion_time(self) -> str:
+        """预估结束时间，处理进度未变化时复用上次结果"""
+        key = (self._value, self.total)
+        if key != self._completion_key:
+            self._completion_str = self.completion_time
+            self._completion_key = key
+        return self._completion_str
+
     def __str__(self):
-        if self.total == 0:
-            return f'{self._title}【{self.progress}】'
-        return f'{self._title}（{self.percentage}）【{self.progress}】〈{self.completion_time}〉'
+        value, total = self._value, self.total
+        if total == 0:
+            return f'{self._title}【{value:>12}】'
+        return (
+            f'{self._title}（{value / total * 100:>7.3f}%）'
+            f'【{value:>12} / {total:<12}】〈{self._get_completion_time()}〉'
+        )
@@ -10,7 +10,6 @@
 @Software    : PyCharm
 @Version     : 1.1.1
 """
-import io
 import logging
 import logging.handlers
 import os.path
@@ -18,6 +17,8 @@ import sys
 import time
 import typing as t
 import warnings
+from os.path import basename as _basename, commonpath as _commonpath, normcase as _normcase
+from os.path import relpath as _relpath, sep as _sep, splitext as _splitext
 
 from colorama import init as colorama_init
 from colorama.ansi import Fore as AnsiFore, Style as AnsiStyle
@@ -38,6 +39,12 @@ WARNING = logging.WARNING
 ERROR = logging.ERROR
 CRITICAL = logging.CRITICAL
 
+# 是否已初始化 colorama，仅在 Windows 下首次创建彩色控制台处理器时初始化
+_colorama_initialized = False
+
+# 非字符串消息的自动格式化模板，下标为参数个数
+_AUTO_FORMATS = tuple(' '.join(['%s'] * n) for n in range(32))
+
 
 class Logger:
     """
@@ -102,6 +109,8 @@ class Logger:
 
         # 添加控制台处理器
         if console:
+            if color:
+                self._init_colorama()
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(level)
             console_handler.setFormatter(LoggerFormatter(color=color, verbose=verbose, rootpath=rootpath))
@@ -124,30 +133,48 @@ class Logger:
     def logger(self):
         return self._logger
 
+    def is_enabled_for(self, level: int) -> bool:
+        """记录器是否会处理该等级的日志，用于在热点路径中跳过日志参数的准备"""
+        return self._logger.isEnabledFor(level)
+
     def debug(self, msg: t.Union[str, t.Any], *args: t.Any, **kwargs: t.Any):
-        msg, *args = self._auto_formatter(msg, *args)
+        if args and not isinstance(msg, str):
+            msg, *args = self._auto_formatter(msg, *args)
         self._logger.debug(msg, *args, **kwargs)
 
     def info(self, msg: t.Union[str, t.Any], *args: t.Any, **kwargs: t.Any):
-        msg, *args = self._auto_formatter(msg, *args)
+        if args and not isinstance(msg, str):
+            msg, *args = self._auto_formatter(msg, *args)
         self._logger.info(msg, *args, **kwargs)
 
     def warning(self, msg: t.Union[str, t.Any], *args: t.Any, **kwargs: t.Any):
-        msg, *args = self._auto_formatter(msg, *args)
+        if args and not isinstance(msg, str):
+            msg, *args = self._auto_formatter(msg, *args)
         self._logger.warning(msg, *args, **kwargs)
 
     def error(self, msg: t.Union[str, t.Any], *args: t.Any, **kwargs: t.Any):
-        msg, *args = self._auto_formatter(msg, *args)
+        if args and not isinstance(msg, str):
+            msg, *args = self._auto_formatter(msg, *args)
         self._logger.error(msg, *args, **kwargs)
 
     def exception(self, msg: t.Union[str, t.Any], *args: t.Any, exc_info=True, **kwargs: t.Any):
-        msg, *args = self._auto_formatter(msg, *args)
+        if args and not isinstance(msg, str):
+            msg, *args = self._auto_formatter(msg, *args)
         self._logger.error(msg, *args, exc_info=exc_info, **kwargs)
 
     def critical(self, msg: t.Union[str, t.Any], *args: t.Any, **kwargs: t.Any):
-        msg, *args = self._auto_formatter(msg, *args)
+        if args and not isinstance(msg, str):
+            msg, *args = self._auto_formatter(msg, *args)
         self._logger.critical(msg, *args, **kwargs)
 
+    @staticmethod
+    def _init_colorama():
+        """在 Windows 下初始化 colorama"""
+        global _colorama_initialized
+        if os.name == 'nt' and not _colorama_initialized:
+            colorama_init()
+            _colorama_initialized = True
+
     @classmethod
     def _supports_color(cls) -> bool:
         """检测控制台是否支持文本着色"""
@@ -159,7 +186,9 @@ class Logger:
     @classmethod
     def _auto_formatter(cls, msg: t.Union[str, t.Any], *args: t.Any):
         if not isinstance(msg, str) and args:
-            return (' '.join(['%s'] * (len(args) + 1)), msg, *args)
+            n = len(args) + 1
+            fmt = _AUTO_FORMATS[n] if n < len(_AUTO_FORMATS) else ' '.join(['%s'] * n)
+            return (fmt, msg, *args)
         return (msg, *args)
 
 
@@ -177,6 +206,7 @@ class LoggerFormatter(logging.Formatter):
     }
     _srcfile = os.path.normcase(__file__)
     _location_cache = {}
+    _normcase_cache: t.Dict[str, str] = {}
 
     def __init__(
             self,
@@ -187,12 +217,17 @@ class LoggerFormatter(logging.Formatter):
     ):
         self._color = color
         self._verbose = verbose
+        self._logging_srcfile = getattr(logging, '_srcfile')
         if rootpath:
             self._rootpath = os.path.abspath(rootpath)
         elif self._verbose and hasattr(sys.modules['__main__'], '__file__'):
             self._rootpath = os.path.dirname(sys.modules['__main__'].__file__)
         else:
             self._rootpath = None
+        self._final_cache: t.Dict[t.Tuple[str, int], str] = {}
+        self._time_cache_sec = -1
+        self._time_cache_str = ''
+        self._frame_skip: t.Optional[int] = None
 
         # 初始化着色工具
         if color:
@@ -200,11 +235,27 @@ class LoggerFormatter(logging.Formatter):
         else:
             self._tint = lambda text, prefix, suffix=None: text
 
+        # 预先生成各日志等级着色后的等级名称
+        self._level_tokens = {
+            levelno: self._tint('%5s' % levelname, color)
+            for levelno, (levelname, color) in self._styles.items()
+        }
+
         fmt = self._formatters['verbose'] if self._verbose else self._formatters['default']
         super(LoggerFormatter, self).__init__(fmt=fmt, datefmt='%Y-%m-%d %H:%M:%S')
 
-    def format(self, record: logging.LogRecord) -> str:
-        levelname, color = self._styles[record.levelno]
+        # 构造时确定格式化函数，避免每条日志判断是否详细输出
+        self.format = self._format_verbose if self._verbose else self._format_default
+        self._render = self._render_verbose if self._verbose else self._render_default
+
+    def _format_verbose(self, record: logging.LogRecord) -> str:
+        record.process_id = self._tint('%5s' % record.process, AnsiFore.MAGENTA)
+        record.thread_name = f'{record.threadName[-15:]:>15}'
+        record.location = self._tint(self._get_location(limit=40)[-40:], AnsiFore.CYAN)
+        return self._format_default(record)
+
+    def _format_default(self, record: logging.LogRecord) -> str:
+        color = self._styles[record.levelno][1]
 
         # 解决毫秒大于 999 导致样式错误的问题
         if record.msecs > 999:
@@ -212,15 +263,15 @@ class LoggerFormatter(logging.Formatter):
             record.created = record.created + 1
 
         # 获取日志信息并着色
-        record.datetime = '%s.%03d' % (self.formatTime(record, self.datefmt), record.msecs)
-        record.levelname = self._tint('%5s' % levelname, color)
-        if self._verbose:
-            record.process_id = self._tint('%5s' % record.process, AnsiFore.MAGENTA)
-            record.thread_name = '%15s' % record.threadName[-15:]
-            record.location = self._tint(self._get_location(limit=40)[-40:], AnsiFore.CYAN)
+        sec = int(record.created)
+        if sec != self._time_cache_sec:
+            self._time_cache_str = self.formatTime(record, self.datefmt)
+            self._time_cache_sec = sec
+        record.datetime = '%s.%03d' % (self._time_cache_str, record.msecs)
+        record.levelname = self._level_tokens[record.levelno]
         record.message = self._tint(record.getMessage(), color)
 
-        formatted = self.formatMessage(record)
+        formatted = self._render(record)
         messages = [formatted.rstrip()]
 
         # 获取异常信息、堆栈信息并着色
@@ -238,45 +289,86 @@ class LoggerFormatter(logging.Formatter):
             )
         return '\n'.join(messages).replace('\n', '\n    ')
 
+    @staticmethod
+    def _render_default(record: logging.LogRecord) -> str:
+        # 等价于 _formatters['default']，直接插值以跳过 formatMessage
+        return f'{record.datetime} {record.levelname} : {record.message}'
+
+    @staticmethod
+    def _render_verbose(record: logging.LogRecord) -> str:
+        # 等价于 _formatters['verbose']，直接插值以跳过 formatMessage
+        return (
+            f'{record.datetime} {record.levelname} {record.process_id} --- '
+            f'[{record.thread_name}] {record.location} : {record.message}'
+        )
+
     def _get_location(self, limit: int) -> str:
-        # 获取调用位置
-        filepath, lineno, func = None, 0, None
-        f = logging.currentframe()
-        while f and hasattr(f, 'f_code'):
+        # 获取调用位置，优先按缓存的栈深度直接定位，校验失败时再逐帧查找
+        f = None
+        if self._frame_skip is not None:
+            try:
+                inner = sys._getframe(self._frame_skip - 1)  # noqa
+            except ValueError:
+                inner = None
+            if inner is not None and self._is_internal_frame(inner) \
+                    and inner.f_back is not None and not self._is_internal_frame(inner.f_back):
+                f = inner.f_back
+        if f is None:
+            f, depth = sys._getframe(), 0  # noqa
+            while f is not None and self._is_internal_frame(f):
+                f, depth = f.f_back, depth + 1
+            self._frame_skip = depth if f is not None else None
+
+        if f is not None:
             co = f.f_code
-            filename = os.path.normcase(co.co_filename)
-            if filename == getattr(logging, '_srcfile') or filename == self._srcfile:
-                f = f.f_back
-                continue
             filepath, lineno, func = co.co_filename, f.f_lineno, co.co_name
-            break
+        else:
+            filepath, lineno, func = None, 0, None
+
+        # 同一调用位置直接返回缓存结果
+        cached = self._final_cache.get((filepath, lineno))
+        if cached is not None:
+            return cached
 
         # 计算相对位置
         if self._rootpath is None:
             self._rootpath = filepath
         if filepath and filepath not in self._location_cache:
-            if self._rootpath != os.path.commonpath([filepath, self._rootpath]):
-                self._rootpath = os.path.commonpath([filepath, self._rootpath])
+            commonpath = _commonpath([filepath, self._rootpath])
+            if self._rootpath != commonpath:
+                self._rootpath = commonpath
                 self._location_cache.clear()
-            relpath = os.path.relpath(filepath, self._rootpath)
+                self._final_cache.clear()
+            relpath = _relpath(filepath, self._rootpath)
             if relpath == '.':
-                relpath = os.path.basename(filepath)
-            self._location_cache[filepath] = os.path.splitext(relpath)[0]
+                relpath = _basename(filepath)
+            self._location_cache[filepath] = _splitext(relpath)[0]
         relpath = self._location_cache.get(filepath, '(unknown)')
 
         # 缩短相对位置
         if (relpath, lineno) not in self._location_cache:
-            location = relpath.replace(os.path.sep, '.') + '.' + func + '(),' + str(lineno)
+            location = relpath.replace(_sep, '.') + '.' + func + '(),' + str(lineno)
             self._location_cache[(relpath, lineno)] = '%-40s' % self._abbreviate(location, limit)
 
-        return self._location_cache.get((relpath, lineno), '(unknown)')
+        location = self._location_cache.get((relpath, lineno), '(unknown)')
+        if filepath:
+            self._final_cache[(filepath, lineno)] = location
+        return location
+
+    def _is_internal_frame(self, frame) -> bool:
+        """判断栈帧是否属于日志模块内部"""
+        co_filename = frame.f_code.co_filename
+        filename = self._normcase_cache.get(co_filename)
+        if filename is None:
+            filename = self._normcase_cache[co_filename] = _normcase(co_filename)
+        return filename == self._logging_srcfile or filename == self._srcfile
 
     @classmethod
     def _abbreviate(cls, location: str, target_length: int) -> str:
         if len(location) <= target_length:
             return location
 
-        right_most_dot_index = location.rindex('.')
+        right_most_dot_index = location.rfind('.')
         if right_most_dot_index == -1:
             return location
 
@@ -287,23 +379,16 @@ class LoggerFormatter(logging.Formatter):
 
         max_possible_trim = len(location) - last_segment_length - left_segments_target_len
 
-        sio = io.StringIO()
-        i, trimmed, in_dot_state = 0, 0, True
-        while i < right_most_dot_index:
-            if location[i] == '.':
-                if trimmed >= max_possible_trim:
-                    break
-                sio.write(location[i])
-                in_dot_state = True
-            else:
-                if in_dot_state:
-                    sio.write(location[i])
-                    in_dot_state = False
-                else:
-                    trimmed += 1
-            i += 1
-        sio.write(location[i:])
-        return sio.getvalue()
+        # 从左至右将各段缩写为首字母，直至缩减长度满足要求
+        segments = location[:right_most_dot_index].split('.')
+        last_segment = location[right_most_dot_index:]
+        abbreviated, trimmed = [], 0
+        for index, segment in enumerate(segments):
+            if index and trimmed >= max_possible_trim:
+                return '.'.join(abbreviated + segments[index:]) + last_segment
+            abbreviated.append(segment[:1])
+            trimmed += max(len(segment) - 1, 0)
+        return '.'.join(abbreviated) + last_segment
 
     @classmethod
     def _safe_unicode(cls, val: t.Union[str, bytes, None]) -> str:
@@ -315,7 +400,3 @@ class LoggerFormatter(logging.Formatter):
             raise TypeError('Expected bytes, unicode, or None; got %r' % type(val))
         except UnicodeDecodeError:
             return repr(val)
-
-
-if os.name == 'nt':
-    colorama_init()
@@ -10,11 +10,11 @@
 @Software    : PyCharm
 @Version     : 1.0.1
 """
-import itertools
 import random
+import re
 import socket
 import typing as t
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 
 __all__ = [
     'get_filesize_for_human',
@@ -28,6 +28,18 @@ __all__ = [
     'get_port_usage',
 ]
 
+# UTC 时区
+_UTC = timezone.utc
+
+# 默认日期格式及其快速解析规则
+_DEFAULT_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+_DEFAULT_DATETIME_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})', re.ASCII)
+
+# 文件大小单位表：(除数, 单位)
+_FILESIZE_UNITS: t.List[t.Tuple[int, str]] = [
+    (1, 'Bytes'), (1 << 10, 'KiB'), (1 << 20, 'MiB'), (1 << 30, 'GiB'), (1 << 40, 'TiB'), (1 << 50, 'PiB'),
+]
+
 
 def get_filesize_for_human(
         filesize: t.Union[int, float, str],
@@ -45,24 +57,17 @@ def get_filesize_for_human(
     except (TypeError, ValueError, UnicodeDecodeError):
         return '0 bytes'
 
-    kb, mb, gb, tb, pb = 1 << 10, 1 << 20, 1 << 30, 1 << 40, 1 << 50
-
     negative = filesize < 0
     if negative:
         filesize = -filesize
 
-    if filesize < kb:
+    # 每 10 位二进制对应一级单位，直接由位长计算单位下标
+    index = min(max(0, (filesize.bit_length() - 1) // 10), len(_FILESIZE_UNITS) - 1)
+    if index == 0:
         value = '1 Byte' if filesize == 1 else '{} Bytes'.format(filesize)
-    elif filesize < mb:
-        value = '{:.{precision}f} KiB'.format(filesize / kb, precision=precision)
-    elif filesize < gb:
-        value = '{:.{precision}f} MiB'.format(filesize / mb, precision=precision)
-    elif filesize < tb:
-        value = '{:.{precision}f} GiB'.format(filesize / gb, precision=precision)
-    elif filesize < pb:
-        value = '{:.{precision}f} TiB'.format(filesize / tb, precision=precision)
     else:
-        value = '{:.{precision}f} PiB'.format(filesize / pb, precision=precision)
+        divisor, suffix = _FILESIZE_UNITS[index]
+        value = '{:.{precision}f} {}'.format(filesize / divisor, suffix, precision=precision)
 
     if negative:
         return '-' + value
@@ -78,13 +83,13 @@ def get_iso8601_now(
     :param tz: 输出时使用的时区，默认为本地时区
     :return: 符合 ISO 8601 标准的日期字符串
     """
-    utc_datetime = datetime.utcnow().replace(tzinfo=timezone(timedelta(hours=0)))
+    utc_datetime = datetime.now(_UTC)
     return utc_datetime.astimezone(tz=tz).isoformat()
 
 
 def get_iso8601_from_datetime(
         datetime_string: str,
-        datetime_format: str = '%Y-%m-%d %H:%M:%S',
+        datetime_format: str = _DEFAULT_DATETIME_FORMAT,
         tz: t.Optional[timezone] = None,
 ) -> str:
     """
@@ -98,7 +103,13 @@ def get_iso8601_from_datetime(
     :param tz: 输出时使用的时区，默认为本地时区
     :return: 符合 ISO 8601 标准的日期字符串
     """
-    local_datetime = datetime.strptime(datetime_string, datetime_format)
+    # 默认格式直接按位解析，避免 strptime 的格式解析开销
+    match = _DEFAULT_DATETIME_PATTERN.fullmatch(datetime_string) \
+        if datetime_format == _DEFAULT_DATETIME_FORMAT else None
+    if match:
+        local_datetime = datetime(*map(int, match.groups()))
+    else:
+        local_datetime = datetime.strptime(datetime_string, datetime_format)
     return local_datetime.astimezone(tz=tz).isoformat()
 
 
@@ -119,7 +130,7 @@ def get_iso8601_from_timestamp(
         timestamp = int(timestamp)
     if not 32536850399 >= timestamp >= 0:
         raise ValueError('时间戳超出处理范围')
-    utc_datetime = datetime.utcfromtimestamp(timestamp).replace(tzinfo=timezone(timedelta(hours=0)))
+    utc_datetime = datetime.fromtimestamp(timestamp, _UTC)
     return utc_datetime.astimezone(tz=tz).isoformat()
 
 
@@ -141,24 +152,39 @@ codecs: t.List[str] = [
 def recovery_garbled_text(
         text: str,
         flag: t.Union[str, t.List[str]] = None,
+        limit: t.Optional[int] = None,
 ) -> t.Iterable[t.Tuple[str, str, str]]:
     """
     乱码恢复辅助工具
 
     :param text: 待恢复的乱码文本
     :param flag: 用于过滤的已知文本或已知文本列表
+    :param limit: 最多返回的结果数量，默认不限制
     :return 编码器、解码器、已恢复文本
     """
-    targets: t.Optional[t.List[str]] = [flag] if isinstance(flag, str) else flag
-    for codec1, codec2 in itertools.permutations(codecs, 2):
+    targets: t.Tuple[str, ...] = (flag,) if isinstance(flag, str) else tuple(flag or ())
+    remaining = -1 if limit is None else limit
+    if remaining == 0:
+        return
+    for i, codec1 in enumerate(codecs):
+        # 编码结果仅与编码器相关，编码失败时直接跳过整行解码器
         try:
-            fixed_text = text.encode(codec1).decode(codec2)
+            encoded = text.encode(codec1)
         except UnicodeError:
             continue
-        else:
+        for j, codec2 in enumerate(codecs):
+            if i == j:
+                continue
+            try:
+                fixed_text = encoded.decode(codec2)
+            except UnicodeError:
+                continue
             if targets and not all(target in fixed_text for target in targets):
                 continue
             yield codec1, codec2, fixed_text
+            remaining -= 1
+            if remaining == 0:
+                return
 
 
 DATA = t.TypeVar('DATA')
@@ -11,11 +11,20 @@
 @Version     : 1.1.1
 """
 import array
+import asyncio
 import concurrent.futures
+import collections
+import functools
+import itertools
 import multiprocessing.managers
+import multiprocessing.resource_tracker
+import multiprocessing.shared_memory
+import os
 import queue
+import sys
 import threading
 import typing as t
+import weakref
 
 from .logger import Logger
 
@@ -28,24 +37,256 @@ _T = t.TypeVar('_T')
 _KT = t.TypeVar('_KT')
 _VT = t.TypeVar('_VT')
 
+# 回收线程的退出标记
+_REAPER_STOP = object()
+
+
+def _read_cgroup_cpu_limit() -> t.Optional[int]:
+    """读取 cgroup 的 CPU 配额（容器中的 CPU 限制），未设置或无法读取时返回 None"""
+    try:
+        with open('/sys/fs/cgroup/cpu.max', 'r') as f:
+            quota, period = f.read().split()[:2]
+    except (OSError, ValueError):
+        try:
+            with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us', 'r') as f:
+                quota = f.read().strip()
+            with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us', 'r') as f:
+                period = f.read().strip()
+        except OSError:
+            return None
+    if quota in ('max', '-1'):
+        return None
+    try:
+        return max(-(-int(quota) // int(period)), 1)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def _get_available_cpus() -> int:
+    """获取当前进程可用的 CPU 核心数，考虑 CPU 亲和性与 cgroup 配额，无法获取时返回逻辑核心数"""
+    if hasattr(os, 'sched_getaffinity'):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    limit = _read_cgroup_cpu_limit() if sys.platform.startswith('linux') else None
+    return min(cpus, limit) if limit else cpus
+
+
+def _get_default_workers(mode: str) -> int:
+    """
+    获取默认的工人上限
+
+    process 模式用于 CPU 密集型任务，取可用核心数（Windows 进程池上限为 61）；
+    thread / asyncio 模式用于 I/O 密集型任务，与标准库线程池相同取可用核心数加 4，且不超过 32。
+    """
+    cpus = _get_available_cpus()
+    if mode == 'process':
+        return min(cpus, 61) if sys.platform == 'win32' else cpus
+    return min(32, cpus + 4)
+
+
+def _noop():
+    """空任务，用于预先启动工人"""
+
+
+def _run_chunk(fn: t.Callable[[t.Any], _T], chunk: t.List) -> t.List[_T]:
+    """在工人中顺序执行一批任务，一批任务仅需一次序列化与一次结果回传"""
+    return [fn(item) for item in chunk]
+
+
+def _star_call(fn: t.Callable[..., _T], args: t.Tuple) -> _T:
+    """将参数元组展开后调用任务函数，供 map 在工人中执行多个可迭代对象组合而成的任务"""
+    return fn(*args)
+
+
+# 进程池任务参数中达到该长度的 bytes / bytearray 经由共享内存传递，较小的数据经由管道传递更快
+_SHARED_BUFFER_THRESHOLD = 1 << 20
+
+
+def _ensure_resource_tracker():
+    """
+    在启动工人进程前启动资源追踪进程
+
+    fork 方式启动的工人进程会继承当前进程的资源追踪进程，若此时尚未启动，工人进程映射共享内存时会启动自己的资源追踪进程，
+    并在退出时误将仍由当前进程管理的共享内存视为泄漏。
+    """
+    if os.name == 'posix':
+        multiprocessing.resource_tracker.ensure_running()
+
+
+def _load_shared_buffer(name: str, size: int, kind: t.Type[t.Union[bytes, bytearray]]) -> t.Union[bytes, bytearray]:
+    shm = multiprocessing.shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf[:size]
+        data = kind(view)
+        view.release()
+    finally:
+        shm.close()
+    return data
+
+
+class _SharedBuffer:
+    """进程池任务参数中的大块二进制数据，序列化时仅传递共享内存名称，工人进程中反序列化为原类型的数据"""
+    __slots__ = ('_shm', '_size', '_kind')
+
+    def __init__(self, data: t.Union[bytes, bytearray]):
+        self._size = len(data)
+        self._kind = type(data)
+        self._shm = multiprocessing.shared_memory.SharedMemory(create=True, size=self._size)
+        self._shm.buf[:self._size] = data
+
+    def __reduce__(self):
+        return _load_shared_buffer, (self._shm.name, self._size, self._kind)
+
+    def close(self):
+        self._shm.close()
+        self._shm.unlink()
+
+
+def _share_buffer(value: t.Any, buffers: t.List[_SharedBuffer]) -> t.Any:
+    if type(value) in (bytes, bytearray) and len(value) >= _SHARED_BUFFER_THRESHOLD:
+        value = _SharedBuffer(value)
+        buffers.append(value)
+    return value
+
+
+def _submit_with_shared_buffers(
+        submit: t.Callable[..., concurrent.futures.Future],
+        fn: t.Callable,
+        args: t.Tuple,
+        kwargs: t.Dict[str, t.Any],
+) -> concurrent.futures.Future:
+    """提交进程池任务，大块二进制参数经由共享内存传递，任务结束后销毁共享内存"""
+    buffers = []
+    args = tuple(_share_buffer(arg, buffers) for arg in args)
+    kwargs = {key: _share_buffer(value, buffers) for key, value in kwargs.items()}
+    if not buffers:
+        return submit(fn, *args, **kwargs)
+
+    def close_buffers(_: t.Any = None):
+        for buffer in buffers:
+            buffer.close()
+
+    try:
+        future = submit(fn, *args, **kwargs)
+    except BaseException:
+        close_buffers()
+        raise
+    future.add_done_callback(close_buffers)
+    return future
+
+
+# 可复用进程池，按工人上限缓存，供多个任务池共享工人进程
+_REUSABLE_EXECUTORS: t.Dict[int, concurrent.futures.ProcessPoolExecutor] = {}
+_REUSABLE_EXECUTORS_LOCK = threading.Lock()
+# 标准库进程池关闭后提交任务时的错误信息
+_SHUTDOWN_ERROR = 'cannot schedule new futures after shutdown'
+
+
+def _get_reusable_executor(
+        max_workers: int,
+        unusable: t.Optional[concurrent.futures.Executor] = None,
+) -> concurrent.futures.ProcessPoolExecutor:
+    """
+    获取可复用进程池，按工人上限缓存标准库进程池，不同工人上限的任务池互不影响
+
+    :param max_workers: 工人上限
+    :param unusable: 提交任务时发现已损坏或已关闭的进程池，缓存的进程池为该对象时重新创建
+    :return: 进程池对象
+    """
+    with _REUSABLE_EXECUTORS_LOCK:
+        executor = _REUSABLE_EXECUTORS.get(max_workers)
+        if executor is None or executor is unusable:
+            _ensure_resource_tracker()
+            executor = _REUSABLE_EXECUTORS[max_workers] = concurrent.futures.ProcessPoolExecutor(max_workers)
+        return executor
+
 
 # noinspection PyUnusedLocal
 class _BoundedPoolExecutor(concurrent.futures.Executor):
-    """无界线程有界进程池"""
-    _semaphore = None
+    """
+    有界池，通过计数器限制同时执行的任务数量，仅在任务数量达到上限时阻塞提交
+
+    注：提交任务与任务完成回调均发生在当前进程中，故进程池同样使用线程条件变量，无需跨进程的信号量。
+    任务完成回调仅将完成通知放入无锁队列，由单独的回收线程批量归还名额，避免工人线程争抢条件变量的锁。
+    """
+    _slots = 0
+    _inflight = 0
+    _closed = False
+    _condition = None
+    _completed = None
+    _reaper = None
+
+    def _init_bounded(self, slots: int):
+        self._slots = slots
+        self._inflight = 0
+        self._condition = threading.Condition(threading.Lock())
+        self._completed = queue.SimpleQueue()
+        self._reaper = threading.Thread(target=self._reap, name='BoundedPoolReaper', daemon=True)
+        self._reaper.start()
+
+    def _reap(self):
+        completed = self._completed
+        while True:
+            # 批量取出已完成的通知，合并为一次名额归还与唤醒
+            notices = [completed.get()]
+            try:
+                while True:
+                    notices.append(completed.get_nowait())
+            except queue.Empty:
+                pass
+            count = notices.count(None)
+            if count:
+                with self._condition:
+                    self._inflight -= count
+                    self._condition.notify(count)
+            if _REAPER_STOP in notices:
+                return
 
     def acquire(self):
-        self._semaphore.acquire()
+        with self._condition:
+            while self._inflight >= self._slots and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            self._inflight += 1
 
     def release(self, fn: concurrent.futures.Future):
-        self._semaphore.release()
+        self._completed.put(None)
 
     def submit(self, fn: t.Callable, *args: t.Any, **kwargs: t.Any):
         self.acquire()
-        future = super().submit(fn, *args, **kwargs)
+        return self._submit_acquired(fn, *args, **kwargs)
+
+    def submit_available(self, fn: t.Callable, *args: t.Any, **kwargs: t.Any) -> t.List[concurrent.futures.Future]:
+        """等待至少有一个空闲名额，一次性占用全部空闲名额并提交相同数量的任务"""
+        with self._condition:
+            while self._inflight >= self._slots and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            count = self._slots - self._inflight
+            self._inflight = self._slots
+        return [self._submit_acquired(fn, *args, **kwargs) for _ in range(count)]
+
+    def _submit_acquired(self, fn: t.Callable, *args: t.Any, **kwargs: t.Any):
+        try:
+            future = super().submit(fn, *args, **kwargs)
+        except BaseException:
+            self._completed.put(None)
+            raise
         future.add_done_callback(self.release)
         return future
 
+    def shutdown(self, *args: t.Any, **kwargs: t.Any):
+        # 先唤醒因名额不足而阻塞的提交者，使其得知已关闭并抛出异常，而非在关闭期间继续等待
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        super().shutdown(*args, **kwargs)
+        if self._reaper is not None and self._reaper.is_alive():
+            self._completed.put(_REAPER_STOP)
+
 
 class _ThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
     """无界线程池"""
@@ -61,17 +302,28 @@ class _BoundedThreadPoolExecutor(_BoundedPoolExecutor, _ThreadPoolExecutor):
 
     def __init__(self, *args: t.Any, **kwargs: t.Any):
         super().__init__(*args, **kwargs)
-        self._semaphore = threading.BoundedSemaphore(self.max_workers)
+        self._init_bounded(self.max_workers)
 
 
 class _ProcessPoolExecutor(concurrent.futures.ProcessPoolExecutor):
-    """无界进程池"""
+    """
+    无界进程池
+
+    任务参数中的大块 bytes / bytearray 经由共享内存传递，工人进程直接从共享内存中读取，无需经过管道转发。
+    """
     _max_workers = None
 
+    def __init__(self, *args: t.Any, **kwargs: t.Any):
+        _ensure_resource_tracker()
+        super().__init__(*args, **kwargs)
+
     @property
     def max_workers(self):
         return self._max_workers
 
+    def submit(self, fn: t.Callable, *args: t.Any, **kwargs: t.Any) -> concurrent.futures.Future:
+        return _submit_with_shared_buffers(super().submit, fn, args, kwargs)
+
 
 class _BoundedProcessPoolExecutor(_BoundedPoolExecutor, _ProcessPoolExecutor):
     """有界进程池"""
@@ -79,40 +331,333 @@ class _BoundedProcessPoolExecutor(_BoundedPoolExecutor, _ProcessPoolExecutor):
 
     def __init__(self, *args: t.Any, **kwargs: t.Any):
         super().__init__(*args, **kwargs)
-        self._semaphore = multiprocessing.BoundedSemaphore(self.max_workers)
+        self._init_bounded(self.max_workers)
+
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+
+class _ReusableProcessPoolExecutor(concurrent.futures.Executor):
+    """
+    可复用进程池，工人进程在多个任务池之间共享，仅首次使用时创建工人进程
+
+    关闭时仅等待本任务池提交的任务结束，不销毁工人进程，工人进程在解释器退出时统一回收。
+    注：工人进程中的全局状态会在多个任务池之间保留。
+    """
+
+    def __init__(self, max_workers: t.Optional[int] = None):
+        self._max_workers = max_workers or _get_default_workers('process')
+        self._executor = _get_reusable_executor(self._max_workers)
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        self._futures: t.Set[concurrent.futures.Future] = set()
+
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    def submit(self, fn: t.Callable, *args: t.Any, **kwargs: t.Any) -> concurrent.futures.Future:
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            try:
+                future = _submit_with_shared_buffers(self._executor.submit, fn, args, kwargs)
+            except RuntimeError as e:
+                # 仅在共享的进程池已损坏（BrokenProcessPool）或已被关闭时重新获取进程池后重试一次，
+                # 其余错误（如解释器正在退出）直接抛出
+                if not isinstance(e, concurrent.futures.BrokenExecutor) and str(e) != _SHUTDOWN_ERROR:
+                    raise
+                self._executor = _get_reusable_executor(self._max_workers, self._executor)
+                future = _submit_with_shared_buffers(self._executor.submit, fn, args, kwargs)
+            self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        return future
+
+    def map(self, fn: t.Callable, *iterables: t.Iterable, timeout: t.Optional[float] = None, chunksize: int = 1):
+        # 与标准库进程池相同，按 chunksize 分批发送给工人，分批任务经由 submit 提交以便关闭时等待
+        if chunksize < 1:
+            raise ValueError('chunksize must be >= 1.')
+        iterator = zip(*iterables)
+        chunks = iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+        results = super().map(functools.partial(_run_chunk, functools.partial(_star_call, fn)), chunks, timeout=timeout)
+        return itertools.chain.from_iterable(results)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._shutdown_lock:
+            self._shutdown = True
+            futures = list(self._futures)
+        if cancel_futures:
+            for future in futures:
+                future.cancel()
+        if wait:
+            concurrent.futures.wait(futures)
+
+
+class _BoundedReusableProcessPoolExecutor(_BoundedPoolExecutor, _ReusableProcessPoolExecutor):
+    """有界可复用进程池"""
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any):
+        super().__init__(*args, **kwargs)
+        self._init_bounded(self.max_workers)
+
+
+class _AsyncioExecutor(concurrent.futures.Executor):
+    """
+    协程池，在后台线程中运行事件循环
+
+    协程函数直接调度到事件循环中并发执行，普通函数交由事件循环的默认线程池执行，适用于 I/O 密集型任务。
+    """
+
+    def __init__(self, max_workers: t.Optional[int] = None):
+        # 普通函数在事件循环的默认线程池中执行，线程数量即为工人上限
+        executor = self._executor = _ThreadPoolExecutor(max_workers=max_workers)
+        self._max_workers = executor.max_workers
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        self._futures: t.Set[concurrent.futures.Future] = set()
+        # 本协程池提交的任务，仅在事件循环线程中读写
+        self._tasks: t.Set[asyncio.Task] = set()
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(executor)
+        self._thread = threading.Thread(target=self._loop.run_forever, name='AsyncioExecutor', daemon=True)
+        self._thread.start()
+        self._closer: t.Optional[threading.Thread] = None
 
     @property
     def max_workers(self):
         return self._max_workers
 
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def submit(self, fn: t.Callable, *args: t.Any, **kwargs: t.Any) -> concurrent.futures.Future:
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            if asyncio.iscoroutinefunction(fn):
+                coroutine = fn(*args, **kwargs)
+            else:
+                coroutine = self._run_in_executor(functools.partial(fn, *args, **kwargs))
+            future = asyncio.run_coroutine_threadsafe(self._run_tracked(coroutine), self._loop)
+            self._futures.add(future)
+            future.add_done_callback(self._futures.discard)
+            return future
+
+    async def _run_in_executor(self, fn: t.Callable):
+        return await self._loop.run_in_executor(None, fn)
+
+    async def _run_tracked(self, coroutine: t.Awaitable):
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            return await coroutine
+        finally:
+            self._tasks.discard(task)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        if wait and threading.current_thread() is self._thread:
+            # 在事件循环线程中等待事件循环中的任务结束将阻塞事件循环自身，与其死锁不如直接报错
+            raise RuntimeError('cannot shutdown with wait=True from the executor event loop')
+        with self._shutdown_lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            futures = list(self._futures)
+        if cancel_futures:
+            for future in futures:
+                future.cancel()
+        if wait:
+            self._close()
+        else:
+            # 不等待时由后台线程在任务全部结束后关闭事件循环，避免停止事件循环后遗留永不完成的任务
+            self._closer = threading.Thread(target=self._close, name='AsyncioExecutorCloser')
+            self._closer.start()
+
+    def _close(self):
+        """等待本协程池提交的任务结束后，依次关闭默认线程池、停止并关闭事件循环"""
+        asyncio.run_coroutine_threadsafe(self._drain(), self._loop).result()
+        # 默认线程池由本类创建，直接关闭即可，无需依赖 Python 3.9 起才提供的 loop.shutdown_default_executor
+        self._executor.shutdown(wait=True)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _drain(self):
+        # 已取消的任务仍需在事件循环中完成取消流程，故等待任务本身而非已提交的 Future，
+        # 仅等待本协程池提交的任务，不等待在事件循环中另行创建的任务
+        tasks = list(self._tasks)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _BoundedAsyncioExecutor(_BoundedPoolExecutor, _AsyncioExecutor):
+    """有界协程池"""
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any):
+        super().__init__(*args, **kwargs)
+        self._init_bounded(self.max_workers)
+
+
+class _SharedMemoryArray:
+    """
+    基于共享内存的数组，读写直接作用于共享内存，无需经过管理器进程转发
+
+    序列化时仅传递共享内存名称，子进程中反序列化后重新映射同一块共享内存。
+    注：读写操作不带锁，需要原子性时请配合 MultiTaskVariable.get_lock 使用。
+    """
+
+    def __init__(
+            self,
+            typecode: str,
+            sequence: t.Optional[t.Sequence] = None,
+            name: t.Optional[str] = None,
+            length: int = 0,
+    ):
+        """
+        创建或映射共享内存数组
+
+        :param typecode: 数组类型
+        :param sequence: 初始数组，仅创建时使用
+        :param name: 共享内存名称，传入时映射已有的共享内存
+        :param length: 数组长度，仅映射时使用
+        """
+        self._typecode = typecode
+        if name is None:
+            sequence = array.array(typecode, sequence or [])
+            length = len(sequence)
+            size = max(sequence.itemsize * length, 1)
+            self._shm = multiprocessing.shared_memory.SharedMemory(create=True, size=size)
+            self._owner = True
+        else:
+            self._shm = multiprocessing.shared_memory.SharedMemory(name=name)
+            self._owner = False
+        self._length = length
+        self._view = self._shm.buf[:array.array(typecode).itemsize * length].cast(typecode)
+        if name is None:
+            self._view[:] = sequence
+
+    def __reduce__(self):
+        return self.__class__, (self._typecode, None, self._shm.name, self._length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        item = self._view[index]
+        return item.tolist() if isinstance(item, memoryview) else item
+
+    def __setitem__(self, index, value):
+        self._view[index] = value
+
+    def __iter__(self):
+        return iter(self._view.tolist())
+
+    def __repr__(self) -> str:
+        return '%s(%r, %r)' % (self.__class__.__name__, self._typecode, self._view.tolist())
+
+    def __del__(self):
+        try:
+            self.close()
+        except BufferError:
+            # 仍有视图引用共享内存时无法释放映射，映射随视图一同回收，创建者已在 close 中销毁共享内存
+            pass
+
+    @property
+    def typecode(self) -> str:
+        return self._typecode
+
+    def tolist(self) -> t.List:
+        return self._view.tolist()
+
+    def ndarray(self, shape: t.Union[int, t.Tuple[int, ...], None] = None):
+        """
+        获取共享内存的 numpy 数组视图，读写直接作用于共享内存，可进行整块的向量化读写，需要安装 numpy
+
+        注：视图与本对象共用共享内存，关闭共享内存前需先释放全部视图。
+
+        :param shape: 视图形状，元素总数需与数组长度一致，默认为一维
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                'Shared memory ndarray cannot be created.',
+                'Please execute `pip install numpy` to install dependencies first.'
+            )
+        view = numpy.asarray(self._view)
+        return view if shape is None else view.reshape(shape)
+
+    def close(self):
+        """
+        释放共享内存映射，创建者同时销毁共享内存
+
+        注：仍有视图引用共享内存时抛出 BufferError，此时创建者已销毁共享内存，释放全部视图后可再次关闭以释放映射。
+        """
+        if getattr(self, '_view', None) is None:
+            return
+        if self._owner:
+            # 先于释放映射销毁共享内存，释放映射失败时不会遗留共享内存
+            self._owner = False
+            self._shm.unlink()
+        self._view.release()
+        self._shm.close()
+        self._view = None
+
+
+class _SharedMemoryValue(_SharedMemoryArray):
+    """基于共享内存的值，通过 value 属性读写"""
+
+    def __init__(self, typecode: str, value: t.Any = None, name: t.Optional[str] = None, length: int = 1):
+        super().__init__(typecode, None if name else [value], name, length)
+
+    def __reduce__(self):
+        return self.__class__, (self._typecode, None, self._shm.name)
+
+    def __repr__(self) -> str:
+        return '%s(%r, %r)' % (self.__class__.__name__, self._typecode, self._view[0])
+
+    @property
+    def value(self) -> t.Any:
+        return self._view[0]
+
+    @value.setter
+    def value(self, value: t.Any):
+        self._view[0] = value
+
 
 class MultiTaskVariable:
-    """多线程、多进程共享变量"""
+    """
+    多线程、多进程共享变量
+
+    注：实例化时根据模式返回 _ThreadVariable 或 _ProcessVariable 子类的实例，模式在构造时即已确定，
+    获取变量时无需再判断模式。本类中的方法为 process 模式的实现，thread 模式的方法直接为标准库构造函数。
+    """
     MODE = {'thread', 'process'}
 
+    def __new__(cls, mode: t.Literal['thread', 'process']):
+        if mode not in cls.MODE:
+            raise ValueError('模式无效，可选值：thread / process')
+        if cls is MultiTaskVariable:
+            cls = _ThreadVariable if mode == 'thread' else _ProcessVariable
+        return super().__new__(cls)
+
     def __init__(self, mode: t.Literal['thread', 'process']):
         """
         初始化共享变量
 
         :param mode: 共享变量模式，可选 thread / process 值
         """
-        if mode not in self.MODE:
-            raise ValueError('模式无效，可选值：thread / process')
-
         self._mode = mode
-        if self._mode == 'process':
-            self._manager = multiprocessing.Manager()
-
-    def __del__(self):
-        if hasattr(self, '_manager'):
-            self._manager.shutdown()
 
     @property
     def manager(self) -> multiprocessing.managers.SyncManager:
         """多进程共享数据管理器"""
-        if self._mode != 'process':
-            raise RuntimeError('共享数据管理器仅适用于 process 模式')
-        return self._manager
+        raise RuntimeError('共享数据管理器仅适用于 process 模式')
+
+    def close(self):
+        """释放共享变量占用的资源，process 模式下关闭已启动的管理器进程"""
 
     def get_lock(self) -> threading.Lock:
         """
@@ -128,9 +673,7 @@ class MultiTaskVariable:
         相关文档：
             https://docs.python.org/zh-cn/3/library/threading.html#threading.Event
         """
-        if self._mode == 'process':
-            return self._manager.Lock()
-        return threading.Lock()
+        return self.manager.Lock()
 
     def get_r_lock(self):
         """
@@ -147,9 +690,7 @@ class MultiTaskVariable:
         相关文档：
             https://docs.python.org/zh-cn/3/library/threading.html#threading.RLock
         """
-        if self._mode == 'process':
-            return self._manager.RLock()
-        return threading.RLock()
+        return self.manager.RLock()
 
     def get_condition(
             self,
@@ -173,9 +714,7 @@ class MultiTaskVariable:
 
         :param lock: 底层锁，如果给出了非 None 的 lock 参数，则它必须为 Lock 或者 RLock 对象
         """
-        if self._mode == 'process':
-            return self._manager.Condition(lock)
-        return threading.Condition(lock)
+        return self.manager.Condition(lock)
 
     def get_semaphore(self, value: int = 1) -> threading.Semaphore:
         """
@@ -193,9 +732,7 @@ class MultiTaskVariable:
 
         :param value: 信号量的初始值
         """
-        if self._mode == 'process':
-            return self._manager.Semaphore(value)
-        return threading.Semaphore(value)
+        return self.manager.Semaphore(value)
 
     def get_bounded_semaphore(self, value: int = 1) -> threading.BoundedSemaphore:
         """
@@ -215,9 +752,7 @@ class MultiTaskVariable:
 
         :param value: 有界信号量的初始值
         """
-        if self._mode == 'process':
-            return self._manager.BoundedSemaphore(value)
-        return threading.BoundedSemaphore(value)
+        return self.manager.BoundedSemaphore(value)
 
     def get_event(self) -> threading.Event:
         """
@@ -235,9 +770,7 @@ class MultiTaskVariable:
         相关文档：
             https://docs.python.org/zh-cn/3/library/threading.html#threading.Event
         """
-        if self._mode == 'process':
-            return self._manager.Event()
-        return threading.Event()
+        return self.manager.Event()
 
     def get_barrier(
             self,
@@ -265,9 +798,7 @@ class MultiTaskVariable:
         :param action: 可调用对象，它会在所有线程被释放时在其中一个线程中自动调用
         :param timeout: 默认的超时时间
         """
-        if self._mode == 'process':
-            return self._manager.Barrier(parties, action, timeout)  # noqa
-        return threading.Barrier(parties, action, timeout)
+        return self.manager.Barrier(parties, action, timeout)  # noqa
 
     def get_queue(self, maxsize: int = 0) -> queue.Queue:
         """
@@ -292,9 +823,7 @@ class MultiTaskVariable:
 
         :param maxsize: 可以放入队列中的项目数的上限
         """
-        if self._mode == 'process':
-            return self._manager.Queue(maxsize)
-        return queue.Queue(maxsize)
+        return self.manager.Queue(maxsize)
 
     def get_namespace(self) -> multiprocessing.managers.Namespace:
         """
@@ -311,43 +840,58 @@ class MultiTaskVariable:
         相关文档：
             https://docs.python.org/zh-cn/3/library/multiprocessing.html#multiprocessing.managers.Namespace
         """
-        if self._mode == 'thread':
-            raise RuntimeError('Not supported in thread mode')
-        return self._manager.Namespace()
+        return self.manager.Namespace()
 
-    def get_array(self, typecode: str, sequence: t.Sequence[_T]) -> t.Sequence[_T]:
+    def get_array(self, typecode: str, sequence: t.Sequence[_T], *, shared: bool = False) -> t.Sequence[_T]:
         """
         数组代理对象：
             创建一个数组并返回它的代理。
 
+        共享内存数组：
+            shared 为 True 时返回基于共享内存的数组，读写直接作用于共享内存，无需经过管理器进程转发，
+            适用于频繁读写的数值数组；读写操作不带锁，需要原子性时请配合 get_lock 使用。
+            已安装 numpy 时可通过 ndarray(shape) 获取共享内存的 numpy 数组视图，在各进程中进行向量化读写。
+
         类型码 typecode 可选值：
             https://docs.python.org/3/library/array.html
 
         :param typecode: 数组类型
         :param sequence: 初始数组
+        :param shared: 是否使用共享内存
         """
-        if self._mode == 'thread':
-            raise RuntimeError('Not supported in thread mode')
-        if typecode not in array.typecodes:
-            raise ValueError('typecode invalid')
-        return self._manager.Array(typecode, sequence)
+        self._check_typecode(typecode, shared)
+        if shared:
+            return _SharedMemoryArray(typecode, sequence)
+        return self.manager.Array(typecode, sequence)
 
-    def get_value(self, typecode: str, value: _T) -> _T:
+    def get_value(self, typecode: str, value: _T, *, shared: bool = False) -> _T:
         """
         值代理对象：
             创建一个具有可写 value 属性的对象并返回它的代理。
 
+        共享内存值：
+            shared 为 True 时返回基于共享内存的值，读写直接作用于共享内存，无需经过管理器进程转发，
+            适用于频繁读写的计数器等场景；读写操作不带锁，需要原子性时请配合 get_lock 使用。
+
         类型码 typecode 可选值：
             https://docs.python.org/3/library/array.html
 
         :param typecode: 值类型
         :param value: 初始值
+        :param shared: 是否使用共享内存
         """
-        if self._mode == 'thread':
-            raise RuntimeError('Not supported in thread mode')
+        self._check_typecode(typecode, shared)
+        if shared:
+            return _SharedMemoryValue(typecode, value)
+        return self.manager.Value(typecode, value)
+
+    @staticmethod
+    def _check_typecode(typecode: str, shared: bool):
         if typecode not in array.typecodes:
             raise ValueError('typecode invalid')
-        return self._manager.Value(typecode, value)
+        # 共享内存通过 memoryview 读写，不支持 Unicode 字符类型
+        if shared and typecode in ('u', 'w'):
+            raise ValueError('typecode invalid')
 
     def get_dict(self, sequence: t.Optional[t.Mapping[_KT, _VT]] = None) -> t.Dict[_KT, _VT]:
         """
@@ -361,11 +905,11 @@ class MultiTaskVariable:
             d['c'] = 3
             print(d)  # {'a': 1, 'b': 2, 'c': 3}
 
+        注：process 模式下每次读写均需经过管理器进程转发，仅用于汇总任务结果时建议改用 MultiTask.map 的返回值。
+
         :param sequence: 初始字典
         """
-        if self._mode == 'process':
-            return self._manager.dict(sequence or {})
-        return dict(sequence or {})
+        return self.manager.dict(sequence or {})
 
     def get_list(self, sequence: t.Optional[t.Sequence[_T]] = None) -> t.List[_T]:
         """
@@ -379,10 +923,66 @@ class MultiTaskVariable:
             l.append(2)
             print(l[1:2])  # [1, 2]
 
+        注：process 模式下每次读写均需经过管理器进程转发，仅用于汇总任务结果时建议改用 MultiTask.map 的返回值。
+
         :param sequence: 初始列表
         """
-        if self._mode == 'process':
-            return self._manager.list(sequence or [])
+        return self.manager.list(sequence or [])
+
+
+class _ProcessVariable(MultiTaskVariable):
+    """
+    process 模式的共享变量，通过管理器进程创建各个共享变量的代理对象
+
+    注：管理器进程在首次获取需要它的共享变量时才启动，仅使用共享内存或不使用共享变量时无需启动管理器进程。
+    """
+
+    def __init__(self, mode: t.Literal['thread', 'process']):
+        super().__init__(mode)
+        self._manager = None
+        self._manager_lock = threading.Lock()
+        self._finalizer = None
+
+    @property
+    def manager(self) -> multiprocessing.managers.SyncManager:
+        if self._manager is None:
+            with self._manager_lock:
+                if self._manager is None:
+                    manager = multiprocessing.Manager()
+                    self._finalizer = weakref.finalize(self, manager.shutdown)
+                    self._manager = manager
+        return self._manager
+
+    def close(self):
+        if self._finalizer is not None:
+            self._finalizer()
+            self._manager = self._finalizer = None
+
+
+class _ThreadVariable(MultiTaskVariable):
+    """thread 模式的共享变量，直接返回标准库对象"""
+    get_lock = staticmethod(threading.Lock)
+    get_r_lock = staticmethod(threading.RLock)
+    get_condition = staticmethod(threading.Condition)
+    get_semaphore = staticmethod(threading.Semaphore)
+    get_bounded_semaphore = staticmethod(threading.BoundedSemaphore)
+    get_event = staticmethod(threading.Event)
+    get_barrier = staticmethod(threading.Barrier)
+    get_queue = staticmethod(queue.Queue)
+
+    def get_namespace(self):
+        raise RuntimeError('Not supported in thread mode')
+
+    def get_array(self, typecode: str, sequence: t.Sequence[_T], *, shared: bool = False):
+        raise RuntimeError('Not supported in thread mode')
+
+    def get_value(self, typecode: str, value: _T, *, shared: bool = False):
+        raise RuntimeError('Not supported in thread mode')
+
+    def get_dict(self, sequence: t.Optional[t.Mapping[_KT, _VT]] = None) -> t.Dict[_KT, _VT]:
+        return dict(sequence or {})
+
+    def get_list(self, sequence: t.Optional[t.Sequence[_T]] = None) -> t.List[_T]:
         return list(sequence or [])
 
 
@@ -397,74 +997,181 @@ class MultiTask:
     'thread' bounded        有界线程池，对 submit 函数进行信号量限制的线程池
     'process'               无界进程池，即原生进程池
     'process' bounded       有界进程池，对 submit 函数进行信号量限制的进程池
+    'asyncio'               协程池，协程函数在事件循环中并发执行，普通函数在事件循环的默认线程池中执行
+    'asyncio' bounded       有界协程池，对 submit 函数进行信号量限制的协程池
+    'process' reusable      可复用进程池，工人上限相同的任务池共享工人进程
     ======================= =================================================
+
+    注：asyncio 模式的共享变量与 thread 模式相同，协程中请勿使用会阻塞事件循环的锁等对象。
     """
-    MODE = {'thread', 'process'}
+    MODE = {'thread', 'process', 'asyncio'}
     EXECUTOR_MAP = {
         'thread': [_ThreadPoolExecutor, _BoundedThreadPoolExecutor],
         'process': [_ProcessPoolExecutor, _BoundedProcessPoolExecutor],
+        'asyncio': [_AsyncioExecutor, _BoundedAsyncioExecutor],
+    }
+    REUSABLE_EXECUTOR_MAP = {
+        'process': [_ReusableProcessPoolExecutor, _BoundedReusableProcessPoolExecutor],
     }
 
     def __init__(
             self,
-            mode: t.Literal['thread', 'process'],
+            mode: t.Literal['thread', 'process', 'asyncio'],
             *,
             bounded: bool = False,
+            reusable: bool = False,
+            prestart: bool = False,
             max_workers: t.Optional[int] = None,
             logger: t.Optional[Logger] = None,
     ):
         """
         初始化任务池
 
-        :param mode: 执行器模式，可选 thread / process 值
-        :param max_workers: 执行器工人上限
+        :param mode: 执行器模式，可选 thread / process / asyncio 值
+        :param reusable: 是否复用工人进程，仅支持 process 模式，适用于频繁创建任务池的场景
+        :param prestart: 是否在初始化时预先启动全部工人，避免首批任务承担进程启动的延迟，主要适用于 process 模式
+        :param max_workers: 执行器工人上限，默认按当前进程可用的 CPU 核心数（含亲和性与容器配额限制）计算
         """
         if mode not in self.MODE:
-            raise ValueError('模式无效，可选值：thread / process')
+            raise ValueError('模式无效，可选值：thread / process / asyncio')
+        if reusable and mode not in self.REUSABLE_EXECUTOR_MAP:
+            raise ValueError('模式无效，复用工人进程仅支持 process 模式')
 
         self._mode = mode
-        self._max_workers = max_workers
         self._logger = logger or Logger('MultiTask')
+        if max_workers is None:
+            max_workers = _get_default_workers(mode)
+            self._logger.debug('未指定工人上限，按可用 CPU 核心数设置为：%d', max_workers)
+        self._max_workers = max_workers
 
         self._executor_total = 0
-        self._executor_pool = self.EXECUTOR_MAP[mode][bounded](max_workers=max_workers)
+        executor_map = self.REUSABLE_EXECUTOR_MAP if reusable else self.EXECUTOR_MAP
+        self._executor_pool = executor_map[mode][bounded](max_workers=max_workers)
+        self._finalizer = weakref.finalize(self, self._executor_pool.shutdown)
         self._logger.debug('已初始化 %s 模式的任务池，池大小：%d', self._mode, self._executor_pool.max_workers)
+        if prestart:
+            # 标准库进程池在提交任务且无空闲工人时才启动新的工人，提交与工人上限相同数量的空任务即可启动全部工人
+            concurrent.futures.wait([self._executor_pool.submit(_noop) for _ in range(self._executor_pool.max_workers)])
+            self._logger.debug('已预先启动 %s 模式的工人', self._mode)
 
-        self._variable = MultiTaskVariable(self._mode)
+        self._variable = MultiTaskVariable('thread' if self._mode == 'asyncio' else self._mode)
         self._logger.debug('已初始化 %s 模式的共享变量', self._mode)
 
     @property
     def variable(self) -> MultiTaskVariable:
         return self._variable
 
-    def __del__(self):
-        if hasattr(self, '_executor_pool'):
-            self.shutdown()
+    def __enter__(self) -> 'MultiTask':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        self._variable.close()
 
     def submit(self, fn: t.Callable, *args, **kwargs) -> concurrent.futures.Future:
         future = self._executor_pool.submit(fn, *args, **kwargs)
         self._executor_total += 1
-        self._logger.debug('已提交 %d 个任务', self._executor_total)
+        if self._logger.is_enabled_for(Logger.DEBUG):
+            self._logger.debug('已提交 %d 个任务', self._executor_total)
         return future
 
     def submit_multi(self, fn: t.Callable, size: int = 0, *args, **kwargs) -> t.List[concurrent.futures.Future]:
-        futures = []
-        for _ in range(size if size > 0 else 0):
-            future = self.submit(fn, *args, **kwargs)
-            self._executor_total += 1
-            self._logger.debug('已提交 %d 个任务', self._executor_total)
-            futures.append(future)
+        submit = self._executor_pool.submit
+        futures = [submit(fn, *args, **kwargs) for _ in range(size if size > 0 else 0)]
+        self._executor_total += len(futures)
+        self._logger.debug('已提交 %d 个任务', self._executor_total)
         return futures
 
     def submit_maxsize(self, fn: t.Callable, *args, **kwargs) -> t.List[concurrent.futures.Future]:
-        futures = []
-        for _ in range(self._max_workers - self._executor_total):
-            future = self.submit(fn, *args, **kwargs)
-            self._executor_total += 1
-            self._logger.debug('已提交 %d 个任务', self._executor_total)
-            futures.append(future)
+        """
+        按空闲名额批量提交任务
+
+        有界池等待至少有一个空闲名额后一次性填满全部空闲名额；无界池提交工人上限与已提交任务数量之差个任务。
+        """
+        if isinstance(self._executor_pool, _BoundedPoolExecutor):
+            futures = self._executor_pool.submit_available(fn, *args, **kwargs)
+        else:
+            count = self._executor_pool.max_workers - self._executor_total
+            futures = [self._executor_pool.submit(fn, *args, **kwargs) for _ in range(count)]
+        self._executor_total += len(futures)
+        self._logger.debug('已提交 %d 个任务', self._executor_total)
         return futures
 
-    def shutdown(self):
-        self._executor_pool.shutdown()
-        self._logger.debug('任务已全部结束，累计提交 %d 个任务', self._executor_total)
+    def map(
+            self,
+            fn: t.Callable[..., _T],
+            *iterables: t.Iterable,
+            timeout: t.Optional[float] = None,
+            chunksize: int = 1,
+    ) -> t.Iterator[_T]:
+        """
+        批量提交任务并按提交顺序返回结果
+
+        仅需汇总任务结果时，直接使用返回值比通过 get_dict / get_list 共享的字典或列表汇总更高效，
+        后者在 process 模式下每次读写均需经过管理器进程转发。
+
+        :param fn: 任务函数
+        :param iterables: 任务参数的可迭代对象，每个可迭代对象对应任务函数的一个位置参数
+        :param timeout: 获取结果的超时时间
+        :param chunksize: process 模式下每次发送给工人的任务数量
+        :return: 任务结果迭代器
+        """
+        items = list(zip(*iterables))
+        self._executor_total += len(items)
+        self._logger.debug('已提交 %d 个任务', self._executor_total)
+        return self._executor_pool.map(fn, *zip(*items), timeout=timeout, chunksize=chunksize)
+
+    def imap(
+            self,
+            fn: t.Callable[[t.Any], _T],
+            iterable: t.Iterable,
+            chunksize: t.Optional[int] = None,
+    ) -> t.Iterator[_T]:
+        """
+        按批提交任务并按提交顺序逐个返回结果
+
+        与 map 不同，任务参数按需从可迭代对象中读取，同时在途的任务批次不超过工人上限的两倍，
+        由结果的消费速度决定提交速度，适用于任务数量巨大或无限的可迭代对象。
+
+        :param fn: 任务函数，接收可迭代对象中的一项作为参数，不支持协程函数
+        :param iterable: 任务参数的可迭代对象
+        :param chunksize: 每批任务数量，默认可获取长度时为长度除以四倍的工人上限，否则为 1
+        :return: 任务结果迭代器
+        """
+        if asyncio.iscoroutinefunction(fn):
+            raise ValueError('任务函数无效，协程函数请使用 submit 或 map 提交')
+        workers = self._executor_pool.max_workers
+        if chunksize is None:
+            chunksize = max(1, len(iterable) // (workers * 4)) if isinstance(iterable, t.Sized) else 1
+        return self._imap(fn, iter(iterable), chunksize, workers * 2)
+
+    def _imap(self, fn: t.Callable[[t.Any], _T], iterator: t.Iterator, chunksize: int, window: int) -> t.Iterator[_T]:
+        pending = collections.deque()
+        while True:
+            while len(pending) < window:
+                chunk = list(itertools.islice(iterator, chunksize))
+                if not chunk:
+                    break
+                pending.append(self._executor_pool.submit(_run_chunk, fn, chunk))
+                self._executor_total += len(chunk)
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """
+        关闭任务池，不再接受新的任务
+
+        注：在任务中关闭自身所在的任务池且 wait 为 True 时，将因等待自身结束而死锁。
+        有界池关闭时会唤醒因名额不足而阻塞的提交者，使其抛出 RuntimeError 异常。
+
+        :param wait: 是否等待已提交的任务全部结束
+        :param cancel_futures: 是否取消尚未开始执行的任务，需要 Python 3.9 及以上版本
+        """
+        if self._finalizer.detach() is None:
+            return
+        if cancel_futures:
+            self._executor_pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+        else:
+            self._executor_pool.shutdown(wait=wait)
+        self._logger.debug('任务池已关闭，累计提交 %d 个任务', self._executor_total)
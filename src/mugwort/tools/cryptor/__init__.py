@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
+import importlib
 
 __all__ = [
     'AESCryptor',
+    'AEADCryptor',
     'TripleDESCryptor',
     'RSACryptor',
     'Ed25519Cryptor',
@@ -10,18 +12,34 @@ __all__ = [
     'X509Cryptor',
 ]
 
-try:
-    import cryptography
-except ImportError:
-    raise ImportError(
-        'Tool `cryptor` cannot be imported.',
-        'Please execute `pip install mugwort[cryptor]` to install dependencies first.'
-    )
-else:
-    from .aes_cryptor import AESCryptor
-    from .des_cryptor import TripleDESCryptor
-    from .rsa_cryptor import RSACryptor
-    from .ed25519_cryptor import Ed25519Cryptor
-    from .x25519_cryptor import X25519Cryptor
-    from .totp_cryptor import TOTPCryptor
-    from .x509_cryptor import X509Cryptor
+_CRYPTOR_MODULES = {
+    'AESCryptor': 'aes_cryptor',
+    'AEADCryptor': 'aead_cryptor',
+    'TripleDESCryptor': 'des_cryptor',
+    'RSACryptor': 'rsa_cryptor',
+    'Ed25519Cryptor': 'ed25519_cryptor',
+    'X25519Cryptor': 'x25519_cryptor',
+    'TOTPCryptor': 'totp_cryptor',
+    'X509Cryptor': 'x509_cryptor',
+}
+
+
+def __getattr__(name: str):
+    # 延迟导入各个密码学工具，仅在首次访问时加载 cryptography 及对应的模块
+    module_name = _CRYPTOR_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    try:
+        import cryptography  # noqa
+    except ImportError:
+        raise ImportError(
+            'Tool `cryptor` cannot be imported.',
+            'Please execute `pip install mugwort[cryptor]` to install dependencies first.'
+        )
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+@Author      : YongJie-Xie
+@Contact     : fsswxyj@qq.com
+@DateTime    : 2026-10-16 15:20
+@Description : 分组密码的通用辅助工具，供 AES / 3DES 等加解密工具共用
+@FileName    : _block
+@License     : MIT License
+@ProjectName : MugwortTools
+@Software    : PyCharm
+@Version     : 1.0.0
+"""
+import collections
+import functools
+import threading
+import typing as t
+
+from cryptography.hazmat.primitives.ciphers import Cipher, CipherAlgorithm, modes
+
+from . import _padding
+
+__all__ = [
+    'BlockCipher',
+]
+
+
+class BlockCipher:
+    """
+    分组密码的通用辅助工具，按算法构造函数与分组长度实例化，各算法的缓存相互独立
+
+    注：不同算法的密钥长度可能相同，故算法对象与常驻上下文的缓存均按实例区分，不可在算法之间共用。
+    """
+
+    def __init__(self, algorithm: t.Callable[[bytes], CipherAlgorithm], block_size: int, context_maxsize: int = 32):
+        """
+        :param algorithm: 算法构造函数，接收密钥返回算法对象
+        :param block_size: 分组长度，以字节为单位
+        :param context_maxsize: 每个线程缓存的常驻上下文数量上限
+        """
+        self._algorithm = algorithm
+        self._algorithm_cached = functools.lru_cache(maxsize=128)(algorithm)
+        self._block_size = block_size
+        self._context_maxsize = context_maxsize
+        self._context_local = threading.local()
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    def get_algorithm(self, key: bytes) -> CipherAlgorithm:
+        """获取密钥对应的算法对象，相同密钥复用已完成校验的对象"""
+        if isinstance(key, bytes):
+            return self._algorithm_cached(key)
+        return self._algorithm(key)
+
+    def get_cached_context(self, key: bytes, mode: str, encrypt: bool):
+        """
+        获取当前线程中密钥对应的常驻 ECB / CTR 上下文，上下文不可跨线程并发使用故按线程缓存
+
+        注：CTR 上下文使用前需先重置 nonce。
+        """
+        contexts = getattr(self._context_local, 'contexts', None)
+        if contexts is None:
+            contexts = self._context_local.contexts = collections.OrderedDict()
+        cache_key = (key, mode, encrypt)
+        context = contexts.get(cache_key)
+        if context is None:
+            mode_object = modes.ECB() if mode == 'ecb' else modes.CTR(bytes(self._block_size))
+            cipher = Cipher(self.get_algorithm(key), mode=mode_object)
+            context = contexts[cache_key] = cipher.encryptor() if encrypt else cipher.decryptor()
+            if len(contexts) > self._context_maxsize:
+                contexts.popitem(last=False)
+        else:
+            contexts.move_to_end(cache_key)
+        return context
+
+    def crypt_ecb_many(
+            self,
+            items: t.List[t.Tuple[bytes, t.Optional[bytes], bytes]],
+            crypt: t.Callable[[bytes, bytes], bytes],
+    ) -> t.List[bytes]:
+        """
+        ECB 模式各数据块相互独立，同一密钥的消息拼接后一次性处理，再按各消息的长度切分结果
+
+        :param items: 由密钥、初始化向量（忽略）、待处理数据组成的元组列表
+        :param crypt: 以数据和密钥完成一次 ECB 模式加解密的函数
+        :return: 与输入顺序一致的处理结果
+        """
+        groups: t.Dict[bytes, t.List[int]] = {}
+        for index, (key, _, data) in enumerate(items):
+            if len(data) % self._block_size:
+                raise ValueError('ECB 模式的数据长度必须为 %d 的整数倍' % self._block_size)
+            groups.setdefault(bytes(key), []).append(index)
+
+        results: t.List[t.Optional[bytes]] = [None] * len(items)
+        for key, indexes in groups.items():
+            output = crypt(b''.join([items[index][2] for index in indexes]), key)
+            position = 0
+            for index in indexes:
+                end = position + len(items[index][2])
+                results[index] = output[position:end]
+                position = end
+        return results
+
+    def cbc_pkcs7_encrypt_into(self, data: bytes, buffer: bytearray, key: bytes, iv: bytes, block_size: int) -> int:
+        """
+        采用 CBC 模式和 PKCS7 填充方式加密，密文直接写入调用方提供的缓冲区
+
+        :param data: 明文数据，支持 bytes / bytearray / memoryview
+        :param buffer: 密文缓冲区，长度至少为 len(data) + block_size + 分组长度 - 1
+        :param key: 密钥
+        :param iv: 初始化向量
+        :param block_size: 填充的数据块大小
+        :return: 写入缓冲区的密文长度
+        """
+        view = memoryview(data)
+        aligned = len(view) - len(view) % block_size
+        out = memoryview(buffer)
+
+        # 对齐部分直接加密，仅对末尾不足一块的数据进行填充
+        encryptor = Cipher(self.get_algorithm(key), mode=modes.CBC(iv)).encryptor()
+        n = encryptor.update_into(view[:aligned], out)
+        n += encryptor.update_into(_padding.pad_pkcs7(view[aligned:], block_size), out[n:])
+        tail = encryptor.finalize()
+        out[n:n + len(tail)] = tail
+        return n + len(tail)
+
+    def cbc_pkcs7_decrypt_into(self, data: bytes, buffer: bytearray, key: bytes, iv: bytes, block_size: int) -> int:
+        """
+        采用 CBC 模式和 PKCS7 填充方式解密，明文直接写入调用方提供的缓冲区
+
+        :param data: 密文数据，支持 bytes / bytearray / memoryview
+        :param buffer: 明文缓冲区，长度至少为 len(data) + 分组长度 - 1
+        :param key: 密钥
+        :param iv: 初始化向量
+        :param block_size: 填充的数据块大小
+        :return: 去除填充后的明文长度
+        """
+        out = memoryview(buffer)
+        decryptor = Cipher(self.get_algorithm(key), mode=modes.CBC(iv)).decryptor()
+        n = decryptor.update_into(data, out)
+        tail = decryptor.finalize()
+        out[n:n + len(tail)] = tail
+        n += len(tail)
+
+        # 仅校验最后一个数据块的填充
+        if n < block_size:
+            raise ValueError('Invalid padding bytes.')
+        last_block = _padding.unpad_pkcs7(out[n - block_size:n], block_size)
+        return n - block_size + len(last_block)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+@Author      : YongJie-Xie
+@Contact     : fsswxyj@qq.com
+@DateTime    : 2026-10-16 00:20
+@Description : 密码学工具的 CPU 特性探测函数
+@FileName    : _cpu
+@License     : MIT License
+@ProjectName : MugwortTools
+@Software    : PyCharm
+@Version     : 1.0.0
+"""
+import functools
+import platform
+import subprocess
+import sys
+import typing as t
+
+__all__ = [
+    'get_cpu_flags',
+    'has_aes',
+    'has_clmul',
+]
+
+# Windows 中 ARMv8 加密扩展（含 AES 与 PMULL 指令）的处理器特性编号
+_PF_ARM_V8_CRYPTO_INSTRUCTIONS_AVAILABLE = 30
+
+
+def _is_arm() -> bool:
+    return platform.machine().lower().startswith(('arm', 'aarch64'))
+
+
+def _read_linux_flags() -> t.Optional[t.FrozenSet[str]]:
+    try:
+        with open('/proc/cpuinfo', 'r', encoding='utf-8', errors='ignore') as f:
+            cpuinfo = f.read()
+    except OSError:
+        return None
+
+    flags = set()
+    for line in cpuinfo.splitlines():
+        name, _, value = line.partition(':')
+        if name.strip() in ('flags', 'Features'):
+            flags.update(value.split())
+    return frozenset(flags) or None
+
+
+def _read_darwin_flags() -> t.Optional[t.FrozenSet[str]]:
+    if _is_arm():
+        # Apple Silicon 均支持 ARMv8 加密扩展，sysctl 中以 FEAT_AES / FEAT_PMULL 标识
+        names = {'hw.optional.arm.FEAT_AES': 'aes', 'hw.optional.arm.FEAT_PMULL': 'pmull'}
+    else:
+        names = {'machdep.cpu.features': None, 'machdep.cpu.leaf7_features': None}
+
+    flags = set()
+    for name, flag in names.items():
+        try:
+            output = subprocess.run(
+                ['sysctl', '-n', name], capture_output=True, text=True, timeout=5,
+            ).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if flag is None:
+            flags.update(output.lower().split())
+        elif output == '1':
+            flags.add(flag)
+    return frozenset(flags) or None
+
+
+def _read_windows_flags() -> t.Optional[t.FrozenSet[str]]:
+    # Windows 仅对 ARM 提供加密扩展的特性编号，x86 无对应编号，视为未知
+    if not _is_arm():
+        return None
+    try:
+        import ctypes
+        available = ctypes.windll.kernel32.IsProcessorFeaturePresent(_PF_ARM_V8_CRYPTO_INSTRUCTIONS_AVAILABLE)
+    except (ImportError, AttributeError, OSError):
+        return None
+    return frozenset(('aes', 'pmull')) if available else frozenset()
+
+
+@functools.lru_cache(maxsize=None)
+def get_cpu_flags() -> t.Optional[t.FrozenSet[str]]:
+    """获取 CPU 特性标识集合，无法获取时返回 None"""
+    if sys.platform.startswith('linux'):
+        return _read_linux_flags()
+    if sys.platform == 'darwin':
+        return _read_darwin_flags()
+    if sys.platform == 'win32':
+        return _read_windows_flags()
+    return None
+
+
+def has_aes() -> t.Optional[bool]:
+    """CPU 是否支持 AES 硬件指令（x86 为 AES-NI，ARM 为 ARMv8 加密扩展），无法判断时返回 None"""
+    flags = get_cpu_flags()
+    if flags is None:
+        return None
+    return 'aes' in flags
+
+
+def has_clmul() -> t.Optional[bool]:
+    """CPU 是否支持无进位乘法指令（x86 为 pclmulqdq，ARM 为 pmull），无法判断时返回 None"""
+    flags = get_cpu_flags()
+    if flags is None:
+        return None
+    return ('pmull' if _is_arm() else 'pclmulqdq') in flags
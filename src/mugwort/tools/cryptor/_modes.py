@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+@Author      : YongJie-Xie
+@Contact     : fsswxyj@qq.com
+@DateTime    : 2026-10-16 10:30
+@Description : 分组密码的加密模式构造函数表
+@FileName    : _modes
+@License     : MIT License
+@ProjectName : MugwortTools
+@Software    : PyCharm
+@Version     : 1.0.0
+"""
+import typing as t
+
+from cryptography.hazmat.primitives.ciphers import modes
+
+__all__ = [
+    'MODES',
+]
+
+
+def _get_decrepit_mode(name: str) -> t.Callable[[bytes], modes.Mode]:
+    """
+    获取 OFB / CFB / CFB8 模式的构造函数
+
+    cryptography 43 起上述模式移至 decrepit 模块，经原模块访问时每次都会触发弃用警告，开销与一次加密相当，
+    故优先直接引用新位置；旧版本没有 decrepit 模块，此时延迟访问原模块以避免导入时触发警告。
+    """
+    try:
+        from cryptography.hazmat.decrepit.ciphers import modes as decrepit_modes
+    except ImportError:
+        return lambda iv: getattr(modes, name)(iv)
+    return getattr(decrepit_modes, name)
+
+
+# 各加密模式的构造函数，均接收初始化向量（XTS 模式为 tweak 值，CTR 模式为 nonce 值，ECB 模式为 None）
+MODES: t.Dict[str, t.Callable[[t.Optional[bytes]], modes.Mode]] = {
+    'cbc': modes.CBC,
+    'xts': modes.XTS,
+    'ecb': lambda iv: modes.ECB(),
+    'ofb': _get_decrepit_mode('OFB'),
+    'cfb': _get_decrepit_mode('CFB'),
+    'cfb8': _get_decrepit_mode('CFB8'),
+    'ctr': modes.CTR,
+}
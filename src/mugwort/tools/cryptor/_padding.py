@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+@Author      : YongJie-Xie
+@Contact     : fsswxyj@qq.com
+@DateTime    : 2026-10-15 22:50
+@Description : 分组密码的填充工具，通过查表完成填充，无需构造填充器对象
+@FileName    : _padding
+@License     : MIT License
+@ProjectName : MugwortTools
+@Software    : PyCharm
+@Version     : 1.0.0
+"""
+import hmac
+import typing as t
+
+__all__ = [
+    'pad_pkcs7',
+    'unpad_pkcs7',
+    'pad_ansix923',
+    'unpad_ansix923',
+]
+
+# 填充内容表，下标为填充长度
+_PKCS7_PADS: t.Tuple[bytes, ...] = tuple(bytes((n,)) * n for n in range(256))
+_ANSIX923_PADS: t.Tuple[bytes, ...] = tuple(bytes(n - 1) + bytes((n,)) if n else b'' for n in range(256))
+
+
+def _check_block_size(block_size: int):
+    if not 0 < block_size <= 255:
+        raise ValueError('数据块大小无效，取值限制：[1, 255]')
+
+
+def _pad(data: bytes, block_size: int, pads: t.Tuple[bytes, ...]) -> bytes:
+    if block_size == 16:
+        # AES 分组长度固定为 16，跳过参数校验并以位运算代替取模
+        return b''.join((data, pads[16 - (len(data) & 15)]))
+    _check_block_size(block_size)
+    return b''.join((data, pads[block_size - len(data) % block_size]))
+
+
+def _unpad(data: bytes, block_size: int, pads: t.Tuple[bytes, ...]) -> bytes:
+    length = len(data)
+    if block_size == 16:
+        if not length or length & 15:
+            raise ValueError('Invalid padding bytes.')
+    else:
+        _check_block_size(block_size)
+        if not length or length % block_size:
+            raise ValueError('Invalid padding bytes.')
+
+    n = data[-1]
+    valid = 0 < n <= block_size
+    valid &= hmac.compare_digest(data[-n:] if n else b'\x00', pads[n])
+    if not valid:
+        raise ValueError('Invalid padding bytes.')
+    return bytes(data[:-n])
+
+
+def pad_pkcs7(data: bytes, block_size: int = 16) -> bytes:
+    """填充 n 个 chr(n) 字符，其中 n 是补齐数据块所需的字节数"""
+    return _pad(data, block_size, _PKCS7_PADS)
+
+
+def unpad_pkcs7(data: bytes, block_size: int = 16) -> bytes:
+    """移除 PKCS7 填充并校验填充内容"""
+    return _unpad(data, block_size, _PKCS7_PADS)
+
+
+def pad_ansix923(data: bytes, block_size: int = 16) -> bytes:
+    """先填充 n-1 个 chr(0) 字符再填充 1 个 chr(n) 字符，其中 n 是补齐数据块所需的字节数"""
+    return _pad(data, block_size, _ANSIX923_PADS)
+
+
+def unpad_ansix923(data: bytes, block_size: int = 16) -> bytes:
+    """移除 ANSIX923 填充并校验填充内容"""
+    return _unpad(data, block_size, _ANSIX923_PADS)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+@Author      : YongJie-Xie
+@Contact     : fsswxyj@qq.com
+@DateTime    : 2026-10-15 23:05
+@Description : 密码学工具的并行处理辅助函数
+@FileName    : _parallel
+@License     : MIT License
+@ProjectName : MugwortTools
+@Software    : PyCharm
+@Version     : 1.0.0
+"""
+import concurrent.futures
+import os
+import typing as t
+
+__all__ = [
+    'PARALLEL_THRESHOLD',
+    'get_workers',
+    'map_batches',
+    'parallel_map',
+    'split_blocks',
+]
+
+_T = t.TypeVar('_T')
+_R = t.TypeVar('_R')
+
+# 数据长度达到该阈值时才进行分块并行处理，避免线程调度开销超过收益
+PARALLEL_THRESHOLD = 1 << 20
+
+
+def get_workers(workers: t.Optional[int] = None) -> int:
+    """获取并行工人数量，默认为 CPU 核心数"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(workers, 1)
+
+
+def parallel_map(
+        fn: t.Callable[[_T], _R],
+        items: t.Iterable[_T],
+        workers: t.Optional[int] = None,
+) -> t.List[_R]:
+    """
+    使用线程池按序处理数据，仅有一个工人或一项数据时直接在当前线程处理
+
+    :param fn: 处理函数
+    :param items: 待处理数据
+    :param workers: 工人数量，默认为 CPU 核心数
+    :return: 与待处理数据顺序一致的处理结果
+    """
+    items = list(items)
+    workers = min(get_workers(workers), len(items))
+    if workers <= 1:
+        return [fn(item) for item in items]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fn, items))
+
+
+def map_batches(
+        fn: t.Callable[[t.List[_T]], t.List[_R]],
+        items: t.Iterable[_T],
+        workers: t.Optional[int] = None,
+) -> t.List[_R]:
+    """
+    将数据按工人数量均分为若干批，每批在一个线程中顺序处理，减少线程池的调度开销
+
+    :param fn: 批处理函数，接收一批数据并返回与之顺序一致的处理结果
+    :param items: 待处理数据
+    :param workers: 工人数量，默认为 CPU 核心数
+    :return: 与待处理数据顺序一致的处理结果
+    """
+    items = list(items)
+    workers = get_workers(workers)
+    size = -(-len(items) // workers) or 1
+    results = []
+    for batch in parallel_map(fn, (items[i:i + size] for i in range(0, len(items), size)), workers):
+        results.extend(batch)
+    return results
+
+
+def split_blocks(length: int, parts: int, block_size: int = 16) -> t.List[t.Tuple[int, int]]:
+    """
+    将数据按数据块边界切分为若干段，末段包含剩余的不完整数据块
+
+    :param length: 数据长度
+    :param parts: 期望的分段数量
+    :param block_size: 数据块大小
+    :return: 各段的起止位置
+    """
+    blocks = length // block_size
+    parts = max(min(parts, blocks), 1)
+    step = blocks // parts * block_size
+    bounds = [(i * step, (i + 1) * step) for i in range(parts)]
+    bounds[-1] = (bounds[-1][0], length)
+    return bounds
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+@Author      : YongJie-Xie
+@Contact     : fsswxyj@qq.com
+@DateTime    : 2026-10-15 23:40
+@Description : 基于各种算法实现的密码学工具
+@FileName    : aead_cryptor
+@License     : MIT License
+@ProjectName : MugwortTools
+@Software    : PyCharm
+@Version     : 1.0.0
+"""
+import functools
+import typing as t
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+
+from . import _cpu
+
+__all__ = [
+    'AEADCryptor',
+]
+
+_AEAD_CLASSES = {
+    'aes-gcm': AESGCM,
+    'chacha20-poly1305': ChaCha20Poly1305,
+}
+
+
+def _detect_algorithm() -> str:
+    """
+    根据 CPU 特性选择 AEAD 算法
+
+    AES-GCM 依赖 AES 指令和无进位乘法指令（x86 为 aes / pclmulqdq，ARM 为 aes / pmull），
+    缺少任一指令时 GHASH 和 AES 均退化为软件实现，此时 ChaCha20-Poly1305 通常快数倍。
+    无法获取 CPU 特性时默认选择 AES-GCM。
+    """
+    if _cpu.has_aes() is False or _cpu.has_clmul() is False:
+        return 'chacha20-poly1305'
+    return 'aes-gcm'
+
+
+class AEADCryptor:
+    """
+    支持 AES-GCM 和 ChaCha20-Poly1305 算法的认证加密工具，无需实例化即可调用。
+
+    默认算法固定为 AES-GCM，保证不同主机间的密文可以互通。
+    ALGORITHM 为导入时根据 CPU 特性推荐的算法：支持 AES 硬件加速时为 AES-GCM，否则为 ChaCha20-Poly1305，
+    仅供选择算法时参考，采用推荐算法时加解密双方需显式指定相同的 algorithm 参数。
+
+    支持的算法：
+    aes-gcm           ：密钥长度 16 / 24 / 32，nonce 长度建议为 12
+    chacha20-poly1305 ：密钥长度 32，nonce 长度限制为 12
+    """
+
+    ALGORITHM = _detect_algorithm()
+
+    @staticmethod
+    def encrypt(
+            data: bytes,
+            key: bytes,
+            nonce: bytes,
+            associated_data: t.Optional[bytes] = None,
+            algorithm: str = 'aes-gcm',
+    ) -> bytes:
+        """
+        认证加密函数
+
+        :param data: 明文数据
+        :param key: 密钥，长度限制：16 / 24 / 32（chacha20-poly1305 仅支持 32）
+        :param nonce: 随机数，长度限制：12，同一密钥下不可重复使用
+        :param associated_data: 附加数据
+        :param algorithm: 算法，可选值：aes-gcm / chacha20-poly1305
+        :return: 密文数据，末尾 16 字节为认证标签
+        """
+        data = _get_aead(key, algorithm).encrypt(nonce, data, associated_data)
+        return data
+
+    @staticmethod
+    def decrypt(
+            data: bytes,
+            key: bytes,
+            nonce: bytes,
+            associated_data: t.Optional[bytes] = None,
+            algorithm: str = 'aes-gcm',
+    ) -> bytes:
+        """
+        认证解密函数，认证失败时抛出 cryptography.exceptions.InvalidTag 异常
+
+        :param data: 密文数据，末尾 16 字节为认证标签
+        :param key: 密钥，长度限制：16 / 24 / 32（chacha20-poly1305 仅支持 32）
+        :param nonce: 随机数，长度限制：12
+        :param associated_data: 附加数据
+        :param algorithm: 算法，可选值：aes-gcm / chacha20-poly1305
+        :return: 明文数据
+        """
+        data = _get_aead(key, algorithm).decrypt(nonce, data, associated_data)
+        return data
+
+
+@functools.lru_cache(maxsize=32)
+def _get_aead_cached(key: bytes, algorithm: str) -> t.Union[AESGCM, ChaCha20Poly1305]:
+    return _AEAD_CLASSES[algorithm](key)
+
+
+def _get_aead(key: bytes, algorithm: str) -> t.Union[AESGCM, ChaCha20Poly1305]:
+    """获取密钥和算法对应的 AEAD 对象，相同密钥复用已完成初始化的对象"""
+    if algorithm not in _AEAD_CLASSES:
+        raise ValueError('算法无效，可选值：%s' % ' / '.join(_AEAD_CLASSES))
+    if isinstance(key, bytes):
+        return _get_aead_cached(key, algorithm)
+    return _AEAD_CLASSES[algorithm](key)
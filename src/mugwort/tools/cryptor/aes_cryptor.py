@@ -11,13 +11,21 @@
 @Software    : PyCharm
 @Version     : 1.0.0
 """
+import functools
+import logging
+import os
+import threading
 import typing as t
 
-from cryptography.hazmat.primitives import padding
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers import Cipher, CipherContext, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from . import _block, _cpu, _modes, _padding, _parallel
 
 __all__ = [
     'AESCryptor',
+    'AESSession',
 ]
 
 
@@ -34,12 +42,18 @@ class AESCryptor:
     CFB8 ：[×]无需填充、[√]需要 iv 值（使用 8 位移位寄存器的密文反馈模式）
     CTR  ：[×]无需填充、[×]无需 iv 值、另需 nonce 值（计数器模式）
     GCM  ：[×]无需填充、[√]需要 iv 值、另需 associated_data 和 tag 值（伽罗瓦/计数器模式，提供附加消息的完整性校验）
+    IGE  ：[×]无需填充、[√]需要 iv 值（无限混淆扩展模式，数据长度需为 16 的整数倍，iv 长度为 32，常用于 Telegram 协议）
 
     支持的填充方式：
     PKCS7    ：填充 n 个 chr(n) 字符，其中 n 是补齐数据块所需的字节数
     ANSIX923 ：先填充 n-1 个 chr(0) 字符再填充 1 个 chr(n) 字符，其中 n 是补齐数据块所需的字节数
+
+    注：HAS_AESNI 表示 CPU 是否支持 AES 硬件指令，无法判断时视为支持；不支持时 AES 吞吐量通常下降一个数量级，
+    认证加密场景可改用 AEADCryptor 的 ChaCha20-Poly1305 算法。
     """
 
+    HAS_AESNI = _cpu.has_aes() is not False
+
     @staticmethod
     def cbc_pkcs7_encryptor(data: bytes, key: bytes, iv: bytes, block_size: int = 16) -> bytes:
         """
@@ -286,6 +300,76 @@ class AESCryptor:
         data = AESCryptor.decrypt_ctr(data, key, nonce)
         return data
 
+    @staticmethod
+    def ctr_encrypt_stream(
+            src_file: t.BinaryIO,
+            dst_file: t.BinaryIO,
+            key: bytes,
+            nonce: bytes,
+            chunk_size: int = 1 << 20,
+    ) -> int:
+        """
+        采用 CTR 模式的文件流加密函数，按块读取、加密并写入，内存占用与数据总长度无关
+
+        注：每块数据仅调用一次 update_into，分块过小会增加调用次数并降低吞吐量，故默认按 1 MiB 分块。
+
+        :param src_file: 明文文件对象，需以二进制模式打开
+        :param dst_file: 密文文件对象，需以二进制模式打开
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param nonce: 随机值，长度限制：16
+        :param chunk_size: 分块大小
+        :return: 处理的数据长度
+        """
+        context = Cipher(_get_algorithm(key), mode=modes.CTR(nonce)).encryptor()
+        return _process_file(context, src_file, dst_file, chunk_size)
+
+    @staticmethod
+    def ctr_decrypt_stream(
+            src_file: t.BinaryIO,
+            dst_file: t.BinaryIO,
+            key: bytes,
+            nonce: bytes,
+            chunk_size: int = 1 << 20,
+    ) -> int:
+        """
+        采用 CTR 模式的文件流解密函数，按块读取、解密并写入，内存占用与数据总长度无关
+
+        :param src_file: 密文文件对象，需以二进制模式打开
+        :param dst_file: 明文文件对象，需以二进制模式打开
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param nonce: 随机值，长度限制：16
+        :param chunk_size: 分块大小
+        :return: 处理的数据长度
+        """
+        context = Cipher(_get_algorithm(key), mode=modes.CTR(nonce)).decryptor()
+        return _process_file(context, src_file, dst_file, chunk_size)
+
+    @staticmethod
+    def ige_encryptor(data: bytes, key: bytes, iv: bytes) -> bytes:
+        """
+        采用 IGE 模式的加密函数，数据长度需为 16 的整数倍
+
+        :param data: 明文数据
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param iv: 初始化向量，长度限制：32，前 16 字节为首个密文块之前的密文，后 16 字节为首个明文块之前的明文
+        :return: 密文数据
+        """
+        data = AESCryptor.encrypt_ige(data, key, iv)
+        return data
+
+    @staticmethod
+    def ige_decryptor(data: bytes, key: bytes, iv: bytes) -> bytes:
+        """
+        采用 IGE 模式的解密函数，数据长度需为 16 的整数倍
+
+        :param data: 密文数据
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param iv: 初始化向量，长度限制：32，前 16 字节为首个密文块之前的密文，后 16 字节为首个明文块之前的明文
+        :return: 明文数据
+        """
+        data = AESCryptor.decrypt_ige(data, key, iv)
+        return data
+
     @staticmethod
     def gcm_encryptor(
             data: bytes, key: bytes, iv: bytes,
@@ -322,95 +406,330 @@ class AESCryptor:
         data = AESCryptor.decrypt_gcm(data, key, iv, associated_data, tag, min_tag_length)
         return data
 
+    @staticmethod
+    def gcm_encrypt_split(
+            data: bytes, key: bytes, iv: bytes,
+            associated_data: bytes,
+    ) -> t.Tuple[memoryview, memoryview]:
+        """
+        采用 GCM 模式的加密函数，密文和标签以同一结果上的视图返回，不复制密文
+
+        :param data: 明文数据
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param iv: 初始化向量，长度限制：[8, 128]
+        :param associated_data: 附加数据
+        :return: 密文数据视图、附加数据标签视图
+        """
+        sealed = memoryview(AESCryptor.gcm_encrypt_sealed(data, key, iv, associated_data))
+        return sealed[:-16], sealed[-16:]
+
+    @staticmethod
+    def gcm_encrypt_sealed(data: bytes, key: bytes, iv: bytes, associated_data: bytes) -> bytes:
+        """
+        采用 GCM 模式的加密函数，返回密文与 16 字节标签的拼接结果，可直接传给 gcm_decrypt_sealed
+
+        :param data: 明文数据
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param iv: 初始化向量，长度限制：[8, 128]
+        :param associated_data: 附加数据
+        :return: 密文数据与附加数据标签的拼接结果
+        """
+        return _get_aesgcm(key).encrypt(iv, data, associated_data)
+
+    @staticmethod
+    def gcm_decrypt_sealed(data: bytes, key: bytes, iv: bytes, associated_data: bytes) -> bytes:
+        """
+        采用 GCM 模式的解密函数，输入为密文与 16 字节标签的拼接结果，无需拆分
+
+        :param data: 密文数据与附加数据标签的拼接结果
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param iv: 初始化向量，长度限制：[8, 128]
+        :param associated_data: 附加数据
+        :return: 明文数据
+        """
+        return _get_aesgcm(key).decrypt(iv, data, associated_data)
+
+    @staticmethod
+    def gcm_encrypt_stream(
+            src_file: t.BinaryIO,
+            dst_file: t.BinaryIO,
+            key: bytes,
+            iv: bytes,
+            associated_data: bytes,
+            chunk_size: int = 1 << 20,
+    ) -> bytes:
+        """
+        采用 GCM 模式的文件流加密函数，按块读取、加密并写入，内存占用与数据总长度无关
+
+        :param src_file: 明文文件对象，需以二进制模式打开
+        :param dst_file: 密文文件对象，需以二进制模式打开
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param iv: 初始化向量，长度限制：[8, 128]
+        :param associated_data: 附加数据
+        :param chunk_size: 分块大小
+        :return: 附加数据标签
+        """
+        context = Cipher(_get_algorithm(key), mode=modes.GCM(iv)).encryptor()
+        if associated_data is not None and len(associated_data):
+            context.authenticate_additional_data(associated_data)
+        _process_file(context, src_file, dst_file, chunk_size)
+        return context.tag
+
+    @staticmethod
+    def gcm_decrypt_stream(
+            src_file: t.BinaryIO,
+            dst_file: t.BinaryIO,
+            key: bytes,
+            iv: bytes,
+            associated_data: bytes,
+            tag: bytes,
+            min_tag_length: int = 16,
+            chunk_size: int = 1 << 20,
+    ) -> int:
+        """
+        采用 GCM 模式的文件流解密函数，按块读取、解密并写入，认证失败时抛出 cryptography.exceptions.InvalidTag 异常
+
+        注：标签在全部数据处理完成后才能校验，认证失败前已写入的明文不可信，调用方应丢弃输出文件。
+
+        :param src_file: 密文文件对象，需以二进制模式打开
+        :param dst_file: 明文文件对象，需以二进制模式打开
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param iv: 初始化向量，长度限制：[8, 128]
+        :param associated_data: 附加数据
+        :param tag: 附加数据标签，长度限制：[4, 16]
+        :param min_tag_length: 附加数据标签的最小长度，取值限制：[4, 16]
+        :param chunk_size: 分块大小
+        :return: 处理的数据长度
+        """
+        context = Cipher(_get_algorithm(key), mode=modes.GCM(iv, tag, min_tag_length)).decryptor()
+        if associated_data is not None and len(associated_data):
+            context.authenticate_additional_data(associated_data)
+        return _process_file(context, src_file, dst_file, chunk_size)
+
+    @staticmethod
+    def aead_encrypt(data: bytes, key: bytes, associated_data: bytes = b'') -> bytes:
+        """
+        认证加密函数，随机生成 12 字节初始化向量并采用 GCM 模式加密，新代码应优先使用该函数代替 CBC 模式加 MAC 的组合
+
+        GCM 模式的加密与认证在同一次调用中完成，且可利用 AES 与无进位乘法硬件指令加速，无需再额外计算 HMAC。
+
+        :param data: 明文数据
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param associated_data: 附加数据
+        :return: 初始化向量、密文数据与 16 字节认证标签的拼接结果
+        """
+        iv = os.urandom(_AEAD_IV_SIZE)
+        return b''.join((iv, _get_aesgcm(key).encrypt(iv, data, associated_data)))
+
+    @staticmethod
+    def aead_decrypt(data: bytes, key: bytes, associated_data: bytes = b'') -> bytes:
+        """
+        认证解密函数，输入为 aead_encrypt 函数的输出，认证失败时抛出 cryptography.exceptions.InvalidTag 异常
+
+        :param data: 初始化向量、密文数据与 16 字节认证标签的拼接结果
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param associated_data: 附加数据
+        :return: 明文数据
+        """
+        if len(data) < _AEAD_IV_SIZE + 16:
+            raise InvalidTag()
+        view = memoryview(data)
+        return _get_aesgcm(key).decrypt(view[:_AEAD_IV_SIZE], view[_AEAD_IV_SIZE:], associated_data)
+
+    @staticmethod
+    def encrypt_many(
+            items: t.Iterable[t.Tuple[bytes, t.Optional[bytes], bytes]],
+            mode: str,
+    ) -> t.List[bytes]:
+        """
+        批量加密函数，不处理填充，适用于一次性加密大量短消息的场景
+
+        ECB 模式将同一密钥的消息合并为一次加密调用；CTR 模式同一密钥的消息复用同一个上下文，仅重置 nonce 值。
+
+        :param items: 由密钥、初始化向量（XTS 模式为 tweak 值，CTR 模式为 nonce 值，ECB 模式为 None）、明文数据组成的元组列表
+        :param mode: 加密模式，可选值：cbc / xts / ecb / ofb / cfb / cfb8 / ctr
+        :return: 与输入顺序一致的密文数据列表
+        """
+        return _crypt_many(items, mode, encrypt=True)
+
+    @staticmethod
+    def decrypt_many(
+            items: t.Iterable[t.Tuple[bytes, t.Optional[bytes], bytes]],
+            mode: str,
+    ) -> t.List[bytes]:
+        """
+        批量解密函数，不处理填充，适用于一次性解密大量短消息的场景
+
+        :param items: 由密钥、初始化向量（XTS 模式为 tweak 值，CTR 模式为 nonce 值，ECB 模式为 None）、密文数据组成的元组列表
+        :param mode: 加密模式，可选值：cbc / xts / ecb / ofb / cfb / cfb8 / ctr
+        :return: 与输入顺序一致的明文数据列表
+        """
+        return _crypt_many(items, mode, encrypt=False)
+
+    @staticmethod
+    def gcm_encrypt_sealed_many(items: t.Iterable[t.Tuple[bytes, bytes, bytes, t.Optional[bytes]]]) -> t.List[bytes]:
+        """
+        采用 GCM 模式的批量加密函数，同一密钥的消息复用同一个 AESGCM 对象
+
+        :param items: 由密钥、初始化向量、明文数据、附加数据组成的元组列表
+        :return: 与输入顺序一致的密文数据与附加数据标签的拼接结果列表
+        """
+        return [_get_aesgcm(key).encrypt(iv, data, associated_data) for key, iv, data, associated_data in items]
+
+    @staticmethod
+    def gcm_decrypt_sealed_many(items: t.Iterable[t.Tuple[bytes, bytes, bytes, t.Optional[bytes]]]) -> t.List[bytes]:
+        """
+        采用 GCM 模式的批量解密函数，任一消息认证失败时抛出 cryptography.exceptions.InvalidTag 异常
+
+        :param items: 由密钥、初始化向量、密文数据与附加数据标签的拼接结果、附加数据组成的元组列表
+        :return: 与输入顺序一致的明文数据列表
+        """
+        return [_get_aesgcm(key).decrypt(iv, data, associated_data) for key, iv, data, associated_data in items]
+
+    @staticmethod
+    def cbc_pkcs7_encrypt_into(data: bytes, buffer: bytearray, key: bytes, iv: bytes, block_size: int = 16) -> int:
+        """
+        采用 CBC 模式和 PKCS7 填充方式的加密函数，密文直接写入调用方提供的缓冲区，不产生中间数据
+
+        :param data: 明文数据，支持 bytes / bytearray / memoryview
+        :param buffer: 密文缓冲区，长度至少为 len(data) + block_size + 15
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param iv: 初始化向量，长度限制：16
+        :param block_size: 数据块大小，取值限制：[0, 255]
+        :return: 写入缓冲区的密文长度
+        """
+        return _CIPHER.cbc_pkcs7_encrypt_into(data, buffer, key, iv, block_size)
+
+    @staticmethod
+    def cbc_pkcs7_decrypt_into(data: bytes, buffer: bytearray, key: bytes, iv: bytes, block_size: int = 16) -> int:
+        """
+        采用 CBC 模式和 PKCS7 填充方式的解密函数，明文直接写入调用方提供的缓冲区，不产生中间数据
+
+        :param data: 密文数据，支持 bytes / bytearray / memoryview
+        :param buffer: 明文缓冲区，长度至少为 len(data) + 15
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param iv: 初始化向量，长度限制：16
+        :param block_size: 数据块大小，取值限制：[0, 255]
+        :return: 去除填充后的明文长度
+        """
+        return _CIPHER.cbc_pkcs7_decrypt_into(data, buffer, key, iv, block_size)
+
+    @staticmethod
+    def ctr_encrypt_into(data: bytes, buffer: bytearray, key: bytes, nonce: bytes) -> int:
+        """
+        采用 CTR 模式的加密函数，密文直接写入调用方提供的缓冲区，可直接传入报文中负载部分的视图而无需复制
+
+        :param data: 明文数据，支持 bytes / bytearray / memoryview
+        :param buffer: 密文缓冲区，长度至少为 len(data)（cryptography 旧版本要求至少为 len(data) + 15）
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param nonce: 随机值，长度限制：16
+        :return: 写入缓冲区的密文长度
+        """
+        return _crypt_ctr_into(data, buffer, key, nonce)
+
+    @staticmethod
+    def ctr_decrypt_into(data: bytes, buffer: bytearray, key: bytes, nonce: bytes) -> int:
+        """
+        采用 CTR 模式的解密函数，明文直接写入调用方提供的缓冲区，可直接传入报文中负载部分的视图而无需复制
+
+        :param data: 密文数据，支持 bytes / bytearray / memoryview
+        :param buffer: 明文缓冲区，长度至少为 len(data)（cryptography 旧版本要求至少为 len(data) + 15）
+        :param key: 密钥，长度限制：16 / 24 / 32
+        :param nonce: 随机值，长度限制：16
+        :return: 写入缓冲区的明文长度
+        """
+        return _crypt_ctr_into(data, buffer, key, nonce)
+
+    @staticmethod
+    def session(key: bytes, mode: str) -> 'AESSession':
+        """
+        创建绑定密钥和加密模式的会话，适用于同一密钥加解密大量小数据的场景
+
+        :param key: 密钥，长度限制：16 / 24 / 32（XTS 模式为 32 / 64）
+        :param mode: 加密模式，可选值：cbc / xts / ecb / ofb / cfb / cfb8 / ctr
+        :return: 会话对象
+        """
+        return AESSession(key, mode)
+
     @staticmethod
     def pad_pkcs7(data: bytes, block_size: int = 16) -> bytes:
-        padder = padding.PKCS7(block_size * 8).padder()
-        return padder.update(data) + padder.finalize()
+        return _padding.pad_pkcs7(data, block_size)
 
     @staticmethod
     def unpad_pkcs7(data: bytes, block_size: int = 16) -> bytes:
-        unpadder = padding.PKCS7(block_size * 8).unpadder()
-        return unpadder.update(data) + unpadder.finalize()
+        return _padding.unpad_pkcs7(data, block_size)
 
     @staticmethod
     def pad_ansix923(data: bytes, block_size: int = 16) -> bytes:
-        padder = padding.ANSIX923(block_size * 8).padder()
-        return padder.update(data) + padder.finalize()
+        return _padding.pad_ansix923(data, block_size)
 
     @staticmethod
     def unpad_ansix923(data: bytes, block_size: int = 16) -> bytes:
-        unpadder = padding.ANSIX923(block_size * 8).unpadder()
-        return unpadder.update(data) + unpadder.finalize()
+        return _padding.unpad_ansix923(data, block_size)
 
     @staticmethod
     def encrypt_cbc(data: bytes, key: bytes, iv: bytes) -> bytes:
-        encryptor = Cipher(algorithms.AES(key), mode=modes.CBC(iv)).encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+        return _crypt(data, key, 'cbc', iv, encrypt=True)
 
     @staticmethod
     def decrypt_cbc(data: bytes, key: bytes, iv: bytes) -> bytes:
-        decryptor = Cipher(algorithms.AES(key), mode=modes.CBC(iv)).decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return _crypt(data, key, 'cbc', iv, encrypt=False)
 
     @staticmethod
     def encrypt_xts(data: bytes, key: bytes, tweak: bytes) -> bytes:
-        encryptor = Cipher(algorithms.AES(key), mode=modes.XTS(tweak)).encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+        return _crypt(data, key, 'xts', tweak, encrypt=True)
 
     @staticmethod
     def decrypt_xts(data: bytes, key: bytes, tweak: bytes) -> bytes:
-        decryptor = Cipher(algorithms.AES(key), mode=modes.XTS(tweak)).decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return _crypt(data, key, 'xts', tweak, encrypt=False)
 
     @staticmethod
     def encrypt_ecb(data: bytes, key: bytes) -> bytes:
-        encryptor = Cipher(algorithms.AES(key), mode=modes.ECB()).encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+        return _crypt(data, key, 'ecb', None, encrypt=True)
 
     @staticmethod
     def decrypt_ecb(data: bytes, key: bytes) -> bytes:
-        decryptor = Cipher(algorithms.AES(key), mode=modes.ECB()).decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return _crypt(data, key, 'ecb', None, encrypt=False)
 
     @staticmethod
     def encrypt_ofb(data: bytes, key: bytes, iv: bytes) -> bytes:
-        encryptor = Cipher(algorithms.AES(key), mode=modes.OFB(iv)).encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+        return _crypt(data, key, 'ofb', iv, encrypt=True)
 
     @staticmethod
     def decrypt_ofb(data: bytes, key: bytes, iv: bytes) -> bytes:
-        decryptor = Cipher(algorithms.AES(key), mode=modes.OFB(iv)).decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return _crypt(data, key, 'ofb', iv, encrypt=False)
 
     @staticmethod
     def encrypt_cfb(data: bytes, key: bytes, iv: bytes) -> bytes:
-        encryptor = Cipher(algorithms.AES(key), mode=modes.CFB(iv)).encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+        return _crypt(data, key, 'cfb', iv, encrypt=True)
 
     @staticmethod
     def decrypt_cfb(data: bytes, key: bytes, iv: bytes) -> bytes:
-        decryptor = Cipher(algorithms.AES(key), mode=modes.CFB(iv)).decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return _crypt(data, key, 'cfb', iv, encrypt=False)
 
     @staticmethod
     def encrypt_cfb8(data: bytes, key: bytes, iv: bytes) -> bytes:
-        encryptor = Cipher(algorithms.AES(key), mode=modes.CFB8(iv)).encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+        return _crypt(data, key, 'cfb8', iv, encrypt=True)
 
     @staticmethod
     def decrypt_cfb8(data: bytes, key: bytes, iv: bytes) -> bytes:
-        decryptor = Cipher(algorithms.AES(key), mode=modes.CFB8(iv)).decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return _crypt(data, key, 'cfb8', iv, encrypt=False)
 
     @staticmethod
-    def encrypt_ctr(data: bytes, key: bytes, nonce: bytes):
-        encryptor = Cipher(algorithms.AES(key), mode=modes.CTR(nonce)).encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+    def encrypt_ctr(data: bytes, key: bytes, nonce: bytes) -> bytes:
+        return _crypt(data, key, 'ctr', nonce, encrypt=True)
 
     @staticmethod
     def decrypt_ctr(data: bytes, key: bytes, nonce: bytes) -> bytes:
-        decryptor = Cipher(algorithms.AES(key), mode=modes.CTR(nonce)).decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return _crypt(data, key, 'ctr', nonce, encrypt=False)
+
+    @staticmethod
+    def encrypt_ige(data: bytes, key: bytes, iv: bytes) -> bytes:
+        return _crypt_ige(data, key, iv, encrypt=True)
+
+    @staticmethod
+    def decrypt_ige(data: bytes, key: bytes, iv: bytes) -> bytes:
+        return _crypt_ige(data, key, iv, encrypt=False)
 
     @staticmethod
     def encrypt_gcm(
@@ -419,11 +738,9 @@ class AESCryptor:
             iv: bytes,
             associated_data: bytes,
     ) -> t.Tuple[bytes, t.Optional[bytes]]:
-        encryptor = Cipher(algorithms.AES(key), mode=modes.GCM(iv)).encryptor()
-        if associated_data:
-            encryptor.authenticate_additional_data(associated_data)
-        data = encryptor.update(data) + encryptor.finalize()
-        return data, encryptor.tag
+        # 一次性 AEAD 接口，输出为密文与 16 字节标签的拼接
+        data = _get_aesgcm(key).encrypt(iv, data, associated_data)
+        return data[:-16], data[-16:]
 
     @staticmethod
     def decrypt_gcm(
@@ -434,7 +751,455 @@ class AESCryptor:
             tag: bytes,
             min_tag_length: int = 16,
     ) -> bytes:
-        decryptor = Cipher(algorithms.AES(key), mode=modes.GCM(iv, tag, min_tag_length)).decryptor()
-        if associated_data:
+        if len(tag) == 16:
+            return _get_aesgcm(key).decrypt(iv, b''.join((data, tag)), associated_data)
+
+        # 一次性 AEAD 接口仅支持 16 字节标签，截短的标签仍使用分步接口
+        decryptor = Cipher(_get_algorithm(key), mode=modes.GCM(iv, tag, min_tag_length)).decryptor()
+        if associated_data is not None and len(associated_data):
             decryptor.authenticate_additional_data(associated_data)
         return decryptor.update(data) + decryptor.finalize()
+
+
+# AES 的算法对象缓存与每个线程的常驻 ECB / CTR 上下文
+_CIPHER = _block.BlockCipher(algorithms.AES, 16)
+_get_algorithm = _CIPHER.get_algorithm
+_get_cached_context = _CIPHER.get_cached_context
+
+# CTR 上下文支持重置 nonce 时，相同密钥可复用常驻上下文（cryptography 43 及以上版本）
+_HAS_RESET_NONCE = hasattr(CipherContext, 'reset_nonce')
+
+# aead_encrypt 随机生成的初始化向量长度，12 字节时 GCM 无需对初始化向量做额外的 GHASH 运算
+_AEAD_IV_SIZE = 12
+
+# 各加密模式的构造函数
+_MODES = _modes.MODES
+
+
+# 解密时可按段并行的链式模式，加密时每个数据块依赖前一个密文块，只能顺序处理
+_CHAINED_MODES = ('cbc', 'cfb', 'cfb8')
+
+
+def _crypt(data: bytes, key: bytes, mode: str, iv: t.Optional[bytes], *, encrypt: bool) -> bytes:
+    """
+    按加密模式表完成一次加解密
+
+    :param data: 待处理数据
+    :param key: 密钥
+    :param mode: 加密模式
+    :param iv: 初始化向量（XTS 模式为 tweak 值，CTR 模式为 nonce 值），ECB 模式为 None
+    :param encrypt: 是否为加密操作
+    :return: 处理结果
+    """
+    size = len(data)
+    if size < _parallel.PARALLEL_THRESHOLD and isinstance(key, bytes):
+        if mode == 'ecb' and not size % 16:
+            # ECB 模式各数据块相互独立，对齐的数据可直接复用常驻上下文，省去每次构造上下文的开销
+            return _get_cached_context(key, 'ecb', encrypt).update(data)
+        if mode == 'ctr' and _HAS_RESET_NONCE and len(iv) == 16:
+            # CTR 模式加解密为同一运算，重置 nonce 后即可复用常驻上下文，省去密钥扩展与上下文初始化
+            context = _get_cached_context(key, 'ctr', True)
+            context.reset_nonce(iv)
+            return context.update(data)
+
+    algorithm = _get_algorithm(key)
+    if size >= _parallel.PARALLEL_THRESHOLD:
+        if mode == 'ecb' or mode == 'ctr' and len(iv) == 16:
+            if mode == 'ctr':
+                factory = lambda offset: Cipher(algorithm, mode=modes.CTR(_advance_counter(iv, offset)))  # noqa
+            else:
+                factory = lambda offset: Cipher(algorithm, mode=modes.ECB())  # noqa
+            return _process_parallel(data, lambda offset: _get_context(factory(offset), encrypt))
+        if not encrypt and mode in _CHAINED_MODES and len(iv) == 16:
+            # CBC / CFB / CFB8 解密时每段仅依赖前一段的最后一个密文块，以其作为该段的 iv 即可独立解密
+            view = memoryview(data)
+            segment_iv = lambda offset: iv if offset == 0 else bytes(view[offset - 16:offset])  # noqa
+            factory = lambda offset: Cipher(algorithm, mode=_MODES[mode](segment_iv(offset)))  # noqa
+            return _process_parallel(data, lambda offset: _get_context(factory(offset), False))
+
+    # 小数据的耗时以 Python 层调用为主，此处内联上下文的创建与处理，不再经由 _get_context 转发
+    cipher = Cipher(algorithm, _MODES[mode](iv))
+    context = cipher.encryptor() if encrypt else cipher.decryptor()
+    # 各模式下 update 已输出全部结果，finalize 返回空字节串，而字节串与空字节串拼接时直接返回原对象，
+    # 故结果仅分配一次；改用 update_into 写入预分配缓冲区反而需要额外的清零与复制
+    return context.update(data) + context.finalize()
+
+
+def _crypt_ctr_into(data: bytes, buffer: bytearray, key: bytes, nonce: bytes) -> int:
+    """
+    完成一次 CTR 模式的加解密并将结果写入缓冲区，CTR 模式加解密为同一运算
+
+    :param data: 待处理数据
+    :param buffer: 输出缓冲区
+    :param key: 密钥
+    :param nonce: 随机值
+    :return: 写入缓冲区的数据长度
+    """
+    if _HAS_RESET_NONCE and isinstance(key, bytes) and len(nonce) == 16:
+        context = _get_cached_context(key, 'ctr', True)
+        context.reset_nonce(nonce)
+        return context.update_into(data, buffer)
+    context = Cipher(_get_algorithm(key), mode=modes.CTR(nonce)).encryptor()
+    n = context.update_into(data, buffer)
+    context.finalize()
+    return n
+
+
+def _crypt_many(
+        items: t.Iterable[t.Tuple[bytes, t.Optional[bytes], bytes]],
+        mode: str,
+        *,
+        encrypt: bool,
+) -> t.List[bytes]:
+    """
+    按加密模式批量完成加解密
+
+    :param items: 由密钥、初始化向量、待处理数据组成的元组列表
+    :param mode: 加密模式
+    :param encrypt: 是否为加密操作
+    :return: 与输入顺序一致的处理结果
+    """
+    if mode not in _MODES:
+        raise ValueError('模式无效，可选值：%s' % ' / '.join(_MODES))
+    items = list(items)
+    if mode == 'ecb':
+        return _CIPHER.crypt_ecb_many(items, lambda data, key: _crypt(data, key, 'ecb', None, encrypt=encrypt))
+
+    results = []
+    append = results.append
+    if mode == 'ctr' and _HAS_RESET_NONCE:
+        contexts = {}
+        for key, iv, data in items:
+            if isinstance(key, bytes) and len(iv) == 16 and len(data) < _parallel.PARALLEL_THRESHOLD:
+                context = contexts.get(key)
+                if context is None:
+                    context = contexts[key] = _get_cached_context(key, 'ctr', True)
+                context.reset_nonce(iv)
+                append(context.update(data))
+            else:
+                append(_crypt(data, key, mode, iv, encrypt=encrypt))
+        return results
+
+    for key, iv, data in items:
+        append(_crypt(data, key, mode, iv, encrypt=encrypt))
+    return results
+
+
+def _get_context(cipher: Cipher, encrypt: bool):
+    return cipher.encryptor() if encrypt else cipher.decryptor()
+
+
+def _crypt_ige(data: bytes, key: bytes, iv: bytes, *, encrypt: bool) -> bytes:
+    """
+    基于 ECB 上下文逐块完成 IGE 模式的加解密
+
+    加密：c[i] = E(p[i] ^ c[i-1]) ^ p[i-1]，解密：p[i] = D(c[i] ^ p[i-1]) ^ c[i-1]，
+    即输出块 = F(输入块 ^ 上一输出块) ^ 上一输入块，异或运算以 128 位整数完成，字节序不影响异或结果。
+
+    :param data: 待处理数据
+    :param key: 密钥
+    :param iv: 初始化向量，前 16 字节为 c[0]，后 16 字节为 p[0]
+    :param encrypt: 是否为加密操作
+    :return: 处理结果
+    """
+    if len(iv) != 32:
+        raise ValueError('IGE 模式的 iv 长度必须为 32')
+    if len(data) % 16:
+        raise ValueError('IGE 模式的数据长度必须为 16 的整数倍')
+
+    context = _get_context(Cipher(_get_algorithm(key), mode=modes.ECB()), encrypt)
+    update, from_bytes = context.update, int.from_bytes
+    if encrypt:
+        prev_out, prev_in = from_bytes(iv[:16], 'little'), from_bytes(iv[16:], 'little')
+    else:
+        prev_out, prev_in = from_bytes(iv[16:], 'little'), from_bytes(iv[:16], 'little')
+
+    # 先批量将数据块转换为整数，循环内仅保留链式依赖的异或与分组运算，最后统一转换回字节串
+    view = memoryview(data)
+    blocks = [from_bytes(view[offset:offset + 16], 'little') for offset in range(0, len(view), 16)]
+    results = []
+    append = results.append
+    for block in blocks:
+        prev_out = from_bytes(update((block ^ prev_out).to_bytes(16, 'little')), 'little') ^ prev_in
+        prev_in = block
+        append(prev_out)
+    context.finalize()
+    return b''.join([block.to_bytes(16, 'little') for block in results])
+
+
+def _process_file(context, src_file: t.BinaryIO, dst_file: t.BinaryIO, chunk_size: int) -> int:
+    """
+    复用读写缓冲区逐块处理文件流，仅适用于输出长度与输入长度一致的流模式
+
+    :param context: 加解密上下文
+    :param src_file: 输入文件对象
+    :param dst_file: 输出文件对象
+    :param chunk_size: 分块大小
+    :return: 处理的数据长度
+    """
+    src_buffer = bytearray(chunk_size)
+    dst_buffer = bytearray(chunk_size + 15)
+    src_view, dst_view = memoryview(src_buffer), memoryview(dst_buffer)
+    total = 0
+    while True:
+        size = src_file.readinto(src_buffer)
+        if not size:
+            break
+        n = context.update_into(src_view[:size], dst_buffer)
+        dst_file.write(dst_view[:n])
+        total += size
+    tail = context.finalize()
+    if tail:
+        dst_file.write(tail)
+    return total
+
+
+def _advance_counter(nonce: bytes, offset: int) -> bytes:
+    """将 CTR 模式的 128 位计数器前进 offset 字节对应的数据块数"""
+    counter = (int.from_bytes(nonce, 'big') + offset // 16) & ((1 << 128) - 1)
+    return counter.to_bytes(16, 'big')
+
+
+def _process_parallel(data: bytes, factory: t.Callable[[int], t.Any]) -> bytes:
+    """
+    将数据按数据块边界分段后并行处理，适用于各数据块相互独立的 ECB / CTR 模式，以及 CBC / CFB / CFB8 模式的解密
+
+    :param data: 待处理数据
+    :param factory: 根据分段起始位置创建加解密上下文的函数
+    :return: 处理结果
+    """
+    view = memoryview(data)
+
+    def process(bound: t.Tuple[int, int]) -> bytes:
+        context = factory(bound[0])
+        return context.update(view[bound[0]:bound[1]]) + context.finalize()
+
+    workers = _parallel.get_workers()
+    return b''.join(_parallel.parallel_map(process, _parallel.split_blocks(len(view), workers), workers))
+
+
+@functools.lru_cache(maxsize=32)
+def _get_aesgcm_cached(key: bytes) -> AESGCM:
+    return AESGCM(key)
+
+
+def _get_aesgcm(key: bytes) -> AESGCM:
+    """获取密钥对应的 AESGCM 对象，相同密钥复用已完成密钥扩展的对象"""
+    if isinstance(key, bytes):
+        return _get_aesgcm_cached(key)
+    return AESGCM(key)
+
+
+if not AESCryptor.HAS_AESNI:
+    logging.getLogger('mugwort.cryptor').info(
+        'AES hardware instructions are not available, AES will run in software and be significantly slower.'
+    )
+
+
+class AESSession:
+    """
+    绑定密钥和加密模式的 AES 会话，不处理填充。
+
+    会话内复用密钥对应的算法对象；ECB 模式无需 iv 值，批量处理时复用同一个加解密上下文，仅进行一次密钥扩展。
+    ECB / CTR 模式的单次加解密复用当前线程中会话常驻的上下文（CTR 模式仅重置 nonce 值），适用于长期持有同一密钥的场景。
+    """
+    MODES = _MODES
+
+    def __init__(self, key: bytes, mode: str):
+        """
+        初始化会话
+
+        :param key: 密钥，长度限制：16 / 24 / 32（XTS 模式为 32 / 64）
+        :param mode: 加密模式，可选值：cbc / xts / ecb / ofb / cfb / cfb8 / ctr
+        """
+        if mode not in self.MODES:
+            raise ValueError('模式无效，可选值：%s' % ' / '.join(self.MODES))
+
+        self._mode = mode
+        self._mode_factory = self.MODES[mode]
+        self._algorithm = algorithms.AES(key)
+        self._local = threading.local()
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    def encryptor(self, iv: t.Optional[bytes] = None):
+        """
+        创建加密上下文
+
+        :param iv: 初始化向量（XTS 模式为 tweak 值，CTR 模式为 nonce 值），ECB 模式无需传入
+        :return: 加密上下文
+        """
+        return Cipher(self._algorithm, mode=self._mode_factory(iv)).encryptor()
+
+    def decryptor(self, iv: t.Optional[bytes] = None):
+        """
+        创建解密上下文
+
+        :param iv: 初始化向量（XTS 模式为 tweak 值，CTR 模式为 nonce 值），ECB 模式无需传入
+        :return: 解密上下文
+        """
+        return Cipher(self._algorithm, mode=self._mode_factory(iv)).decryptor()
+
+    def encrypt(self, data: bytes, iv: t.Optional[bytes] = None) -> bytes:
+        """
+        加密函数
+
+        :param data: 明文数据，CBC / ECB 模式下长度需为 16 的整数倍
+        :param iv: 初始化向量（XTS 模式为 tweak 值，CTR 模式为 nonce 值），ECB 模式无需传入
+        :return: 密文数据
+        """
+        return self._process(data, iv, encrypt=True)
+
+    def decrypt(self, data: bytes, iv: t.Optional[bytes] = None) -> bytes:
+        """
+        解密函数
+
+        :param data: 密文数据
+        :param iv: 初始化向量（XTS 模式为 tweak 值，CTR 模式为 nonce 值），ECB 模式无需传入
+        :return: 明文数据
+        """
+        return self._process(data, iv, encrypt=False)
+
+    def encrypt_into(self, data: bytes, buffer: bytearray, iv: t.Optional[bytes] = None) -> int:
+        """
+        加密函数，密文直接写入调用方提供的缓冲区
+
+        :param data: 明文数据，支持 bytes / bytearray / memoryview
+        :param buffer: 密文缓冲区，长度至少为 len(data) + 15
+        :param iv: 初始化向量（XTS 模式为 tweak 值，CTR 模式为 nonce 值），ECB 模式无需传入
+        :return: 写入缓冲区的密文长度
+        """
+        return self._process_into(self.encryptor(iv), data, buffer)
+
+    def decrypt_into(self, data: bytes, buffer: bytearray, iv: t.Optional[bytes] = None) -> int:
+        """
+        解密函数，明文直接写入调用方提供的缓冲区
+
+        :param data: 密文数据，支持 bytes / bytearray / memoryview
+        :param buffer: 明文缓冲区，长度至少为 len(data) + 15
+        :param iv: 初始化向量（XTS 模式为 tweak 值，CTR 模式为 nonce 值），ECB 模式无需传入
+        :return: 写入缓冲区的明文长度
+        """
+        return self._process_into(self.decryptor(iv), data, buffer)
+
+    def encrypt_stream(self, chunks: t.Iterable[bytes], iv: t.Optional[bytes] = None) -> t.Iterator[bytes]:
+        """
+        流式加密函数，逐块产出密文，无需拼接完整密文
+
+        :param chunks: 明文数据块迭代器
+        :param iv: 初始化向量（XTS 模式为 tweak 值，CTR 模式为 nonce 值），ECB 模式无需传入
+        :return: 密文数据块迭代器
+        """
+        return self._process_stream(self.encryptor(iv), chunks)
+
+    def decrypt_stream(self, chunks: t.Iterable[bytes], iv: t.Optional[bytes] = None) -> t.Iterator[bytes]:
+        """
+        流式解密函数，逐块产出明文，无需拼接完整明文
+
+        :param chunks: 密文数据块迭代器
+        :param iv: 初始化向量（XTS 模式为 tweak 值，CTR 模式为 nonce 值），ECB 模式无需传入
+        :return: 明文数据块迭代器
+        """
+        return self._process_stream(self.decryptor(iv), chunks)
+
+    def encrypt_many(
+            self,
+            items: t.Iterable[bytes],
+            ivs: t.Optional[t.Iterable[bytes]] = None,
+    ) -> t.List[bytes]:
+        """
+        批量加密函数
+
+        :param items: 明文数据列表
+        :param ivs: 与明文数据一一对应的初始化向量列表，ECB 模式无需传入
+        :return: 密文数据列表
+        """
+        return self._process_many(self.encryptor, items, ivs)
+
+    def decrypt_many(
+            self,
+            items: t.Iterable[bytes],
+            ivs: t.Optional[t.Iterable[bytes]] = None,
+    ) -> t.List[bytes]:
+        """
+        批量解密函数
+
+        :param items: 密文数据列表
+        :param ivs: 与密文数据一一对应的初始化向量列表，ECB 模式无需传入
+        :return: 明文数据列表
+        """
+        return self._process_many(self.decryptor, items, ivs)
+
+    def _process(self, data: bytes, iv: t.Optional[bytes], *, encrypt: bool) -> bytes:
+        if self._mode == 'ecb' and not len(data) % 16:
+            return self._get_resident_context(encrypt).update(data)
+        if self._mode == 'ctr' and _HAS_RESET_NONCE and iv is not None and len(iv) == 16:
+            # CTR 模式加解密为同一运算，共用一个常驻上下文
+            context = self._get_resident_context(True)
+            context.reset_nonce(iv)
+            return context.update(data)
+        context = self.encryptor(iv) if encrypt else self.decryptor(iv)
+        return context.update(data) + context.finalize()
+
+    def _get_resident_context(self, encrypt: bool):
+        """获取当前线程中会话常驻的 ECB / CTR 上下文，上下文不可跨线程并发使用故按线程保存"""
+        name = 'encryptor' if encrypt else 'decryptor'
+        context = getattr(self._local, name, None)
+        if context is None:
+            iv = bytes(16) if self._mode == 'ctr' else None
+            context = self.encryptor(iv) if encrypt else self.decryptor(iv)
+            setattr(self._local, name, context)
+        return context
+
+    @staticmethod
+    def _process_into(context, data: bytes, buffer: bytearray) -> int:
+        out = memoryview(buffer)
+        n = context.update_into(data, out)
+        tail = context.finalize()
+        out[n:n + len(tail)] = tail
+        return n + len(tail)
+
+    @staticmethod
+    def _process_stream(context, chunks: t.Iterable[bytes]) -> t.Iterator[bytes]:
+        for chunk in chunks:
+            processed = context.update(chunk)
+            if processed:
+                yield processed
+        tail = context.finalize()
+        if tail:
+            yield tail
+
+    def _process_many(
+            self,
+            factory: t.Callable[[t.Optional[bytes]], t.Any],
+            items: t.Iterable[bytes],
+            ivs: t.Optional[t.Iterable[bytes]],
+    ) -> t.List[bytes]:
+        if self._mode == 'ecb':
+            # ECB 模式各数据块相互独立，复用同一个上下文
+            context = factory(None)
+            results = []
+            for item in items:
+                if len(item) % 16:
+                    raise ValueError('ECB 模式的数据长度必须为 16 的整数倍')
+                results.append(context.update(item))
+            context.finalize()
+            return results
+
+        items, ivs = list(items), None if ivs is None else list(ivs)
+        if ivs is None or len(ivs) != len(items):
+            raise ValueError('%s 模式需要传入与数据一一对应的 iv 值' % self._mode.upper())
+        results = []
+        if self._mode == 'ctr' and _HAS_RESET_NONCE and all(len(iv) == 16 for iv in ivs):
+            # CTR 模式复用同一个上下文，逐条重置 nonce 值
+            context = factory(bytes(16))
+            for item, iv in zip(items, ivs):
+                context.reset_nonce(iv)
+                results.append(context.update(item))
+            return results
+        for item, iv in zip(items, ivs):
+            context = factory(iv)
+            results.append(context.update(item) + context.finalize())
+        return results
@@ -11,8 +11,17 @@
 @Software    : PyCharm
 @Version     : 1.0.0
 """
-from cryptography.hazmat.primitives import padding
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+import typing as t
+
+from cryptography.hazmat.primitives.ciphers import Cipher
+
+from . import _block, _modes, _padding, _parallel
+
+try:
+    # cryptography 43 起 TripleDES 移至 decrepit 模块，经原模块访问时每次都会触发弃用警告
+    from cryptography.hazmat.decrepit.ciphers.algorithms import TripleDES
+except ImportError:
+    from cryptography.hazmat.primitives.ciphers.algorithms import TripleDES
 
 __all__ = [
     'TripleDESCryptor',
@@ -24,6 +33,7 @@ class TripleDESCryptor:
     由 3DES 算法实现，支持常用加密模式和常用填充方式且兼容 DES 算法的加解密工具，无需实例化即可调用。
 
     注：当密钥长度为 8 时，前两重 DES 操作会相互抵消，等价于 DES 算法。
+    注：3DES 仅用于兼容已有系统，新代码应使用函数签名一致的 AESCryptor，需要完整性校验时使用 AEADCryptor。
 
     支持的加密模式：
     CBC  ：[√]需要填充、[√]需要 iv 值（密码块链接模式，常用）
@@ -93,8 +103,8 @@ class TripleDESCryptor:
         :param block_size: 数据块大小，取值限制：[0, 255]
         :return: 明文数据
         """
-        data = TripleDESCryptor.unpad_ansix923(data, block_size)
         data = TripleDESCryptor.decrypt_cbc(data, key, iv)
+        data = TripleDESCryptor.unpad_ansix923(data, block_size)
         return data
 
     @staticmethod
@@ -121,8 +131,8 @@ class TripleDESCryptor:
         :param block_size: 数据块大小，取值限制：[0, 255]
         :return: 明文数据
         """
-        data = TripleDESCryptor.unpad_pkcs7(data, block_size)
         data = TripleDESCryptor.decrypt_ecb(data, key)
+        data = TripleDESCryptor.unpad_pkcs7(data, block_size)
         return data
 
     @staticmethod
@@ -149,8 +159,8 @@ class TripleDESCryptor:
         :param block_size: 数据块大小，取值限制：[0, 255]
         :return: 明文数据
         """
-        data = TripleDESCryptor.unpad_ansix923(data, block_size)
         data = TripleDESCryptor.decrypt_ecb(data, key)
+        data = TripleDESCryptor.unpad_ansix923(data, block_size)
         return data
 
     @staticmethod
@@ -231,72 +241,202 @@ class TripleDESCryptor:
         data = TripleDESCryptor.decrypt_cfb8(data, key, iv)
         return data
 
+    @staticmethod
+    def cbc_pkcs7_encrypt_into(data: bytes, buffer: bytearray, key: bytes, iv: bytes, block_size: int = 16) -> int:
+        """
+        采用 CBC 模式和 PKCS7 填充方式的加密函数，密文直接写入调用方提供的缓冲区，不产生中间数据
+
+        :param data: 明文数据，支持 bytes / bytearray / memoryview
+        :param buffer: 密文缓冲区，长度至少为 len(data) + block_size + 7
+        :param key: 密钥，长度限制：8 / 16 / 24
+        :param iv: 初始化向量，长度限制：8
+        :param block_size: 数据块大小，取值限制：[0, 255]
+        :return: 写入缓冲区的密文长度
+        """
+        return _CIPHER.cbc_pkcs7_encrypt_into(data, buffer, key, iv, block_size)
+
+    @staticmethod
+    def cbc_pkcs7_decrypt_into(data: bytes, buffer: bytearray, key: bytes, iv: bytes, block_size: int = 16) -> int:
+        """
+        采用 CBC 模式和 PKCS7 填充方式的解密函数，明文直接写入调用方提供的缓冲区，不产生中间数据
+
+        :param data: 密文数据，支持 bytes / bytearray / memoryview
+        :param buffer: 明文缓冲区，长度至少为 len(data) + 7
+        :param key: 密钥，长度限制：8 / 16 / 24
+        :param iv: 初始化向量，长度限制：8
+        :param block_size: 数据块大小，取值限制：[0, 255]
+        :return: 去除填充后的明文长度
+        """
+        return _CIPHER.cbc_pkcs7_decrypt_into(data, buffer, key, iv, block_size)
+
     @staticmethod
     def pad_pkcs7(data: bytes, block_size: int = 16) -> bytes:
-        padder = padding.PKCS7(block_size * 8).padder()
-        return padder.update(data) + padder.finalize()
+        return _padding.pad_pkcs7(data, block_size)
 
     @staticmethod
     def unpad_pkcs7(data: bytes, block_size: int = 16) -> bytes:
-        unpadder = padding.PKCS7(block_size * 8).unpadder()
-        return unpadder.update(data) + unpadder.finalize()
+        return _padding.unpad_pkcs7(data, block_size)
 
     @staticmethod
     def pad_ansix923(data: bytes, block_size: int = 16) -> bytes:
-        padder = padding.ANSIX923(block_size * 8).padder()
-        return padder.update(data) + padder.finalize()
+        return _padding.pad_ansix923(data, block_size)
 
     @staticmethod
     def unpad_ansix923(data: bytes, block_size: int = 16) -> bytes:
-        unpadder = padding.ANSIX923(block_size * 8).unpadder()
-        return unpadder.update(data) + unpadder.finalize()
+        return _padding.unpad_ansix923(data, block_size)
 
     @staticmethod
     def encrypt_cbc(data: bytes, key: bytes, iv: bytes) -> bytes:
-        encryptor = Cipher(algorithms.TripleDES(key), mode=modes.CBC(iv)).encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+        return _crypt(data, key, 'cbc', iv, encrypt=True)
 
     @staticmethod
     def decrypt_cbc(data: bytes, key: bytes, iv: bytes) -> bytes:
-        decryptor = Cipher(algorithms.TripleDES(key), mode=modes.CBC(iv)).decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return _crypt(data, key, 'cbc', iv, encrypt=False)
 
     @staticmethod
     def encrypt_ecb(data: bytes, key: bytes) -> bytes:
-        encryptor = Cipher(algorithms.TripleDES(key), mode=modes.ECB()).encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+        return _crypt(data, key, 'ecb', None, encrypt=True)
 
     @staticmethod
     def decrypt_ecb(data: bytes, key: bytes) -> bytes:
-        decryptor = Cipher(algorithms.TripleDES(key), mode=modes.ECB()).decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return _crypt(data, key, 'ecb', None, encrypt=False)
 
     @staticmethod
     def encrypt_ofb(data: bytes, key: bytes, iv: bytes) -> bytes:
-        encryptor = Cipher(algorithms.TripleDES(key), mode=modes.OFB(iv)).encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+        return _crypt(data, key, 'ofb', iv, encrypt=True)
 
     @staticmethod
     def decrypt_ofb(data: bytes, key: bytes, iv: bytes) -> bytes:
-        decryptor = Cipher(algorithms.TripleDES(key), mode=modes.OFB(iv)).decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return _crypt(data, key, 'ofb', iv, encrypt=False)
 
     @staticmethod
     def encrypt_cfb(data: bytes, key: bytes, iv: bytes) -> bytes:
-        encryptor = Cipher(algorithms.TripleDES(key), mode=modes.CFB(iv)).encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+        return _crypt(data, key, 'cfb', iv, encrypt=True)
 
     @staticmethod
     def decrypt_cfb(data: bytes, key: bytes, iv: bytes) -> bytes:
-        decryptor = Cipher(algorithms.TripleDES(key), mode=modes.CFB(iv)).decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return _crypt(data, key, 'cfb', iv, encrypt=False)
 
     @staticmethod
     def encrypt_cfb8(data: bytes, key: bytes, iv: bytes) -> bytes:
-        encryptor = Cipher(algorithms.TripleDES(key), mode=modes.CFB8(iv)).encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+        return _crypt(data, key, 'cfb8', iv, encrypt=True)
 
     @staticmethod
     def decrypt_cfb8(data: bytes, key: bytes, iv: bytes) -> bytes:
-        decryptor = Cipher(algorithms.TripleDES(key), mode=modes.CFB8(iv)).decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return _crypt(data, key, 'cfb8', iv, encrypt=False)
+
+    @staticmethod
+    def encrypt_many(
+            items: t.Iterable[t.Tuple[bytes, t.Optional[bytes], bytes]],
+            mode: str,
+    ) -> t.List[bytes]:
+        """
+        批量加密函数，不处理填充，适用于一次性加密大量短消息的场景
+
+        ECB 模式将同一密钥的消息合并为一次加密调用，其余模式逐条加密并复用密钥对应的算法对象。
+
+        :param items: 由密钥、初始化向量（ECB 模式为 None）、明文数据组成的元组列表
+        :param mode: 加密模式，可选值：cbc / ecb / ofb / cfb / cfb8
+        :return: 与输入顺序一致的密文数据列表
+        """
+        return _crypt_many(items, mode, encrypt=True)
+
+    @staticmethod
+    def decrypt_many(
+            items: t.Iterable[t.Tuple[bytes, t.Optional[bytes], bytes]],
+            mode: str,
+    ) -> t.List[bytes]:
+        """
+        批量解密函数，不处理填充，适用于一次性解密大量短消息的场景
+
+        :param items: 由密钥、初始化向量（ECB 模式为 None）、密文数据组成的元组列表
+        :param mode: 加密模式，可选值：cbc / ecb / ofb / cfb / cfb8
+        :return: 与输入顺序一致的明文数据列表
+        """
+        return _crypt_many(items, mode, encrypt=False)
+
+
+# 各加密模式的构造函数，3DES 仅支持以下模式
+_MODES = {name: _modes.MODES[name] for name in ('cbc', 'ecb', 'ofb', 'cfb', 'cfb8')}
+
+# 解密时可按段并行的链式模式，加密时每个数据块依赖前一个密文块，只能顺序处理
+_CHAINED_MODES = ('cbc', 'cfb', 'cfb8')
+
+# 3DES 吞吐量远低于有硬件加速的 AES，数据长度达到 64 KiB 即可抵消分段并行的调度开销
+_PARALLEL_THRESHOLD = 1 << 16
+
+# 3DES 的算法对象缓存与每个线程的常驻 ECB 上下文
+_CIPHER = _block.BlockCipher(TripleDES, 8)
+_get_algorithm = _CIPHER.get_algorithm
+
+
+def _crypt(data: bytes, key: bytes, mode: str, iv: t.Optional[bytes], *, encrypt: bool) -> bytes:
+    """
+    按加密模式表完成一次加解密
+
+    :param data: 待处理数据
+    :param key: 密钥
+    :param mode: 加密模式
+    :param iv: 初始化向量，ECB 模式为 None
+    :param encrypt: 是否为加密操作
+    :return: 处理结果
+    """
+    if len(data) >= _PARALLEL_THRESHOLD:
+        if mode == 'ecb' and not len(data) % 8 or not encrypt and mode in _CHAINED_MODES and len(iv) == 8:
+            return _crypt_parallel(data, key, mode, iv, encrypt=encrypt)
+    if mode == 'ecb' and not len(data) % 8 and isinstance(key, bytes):
+        # ECB 模式各数据块相互独立，对齐的数据可直接复用常驻上下文，省去每次构造上下文与密钥扩展的开销
+        return _CIPHER.get_cached_context(key, 'ecb', encrypt).update(data)
+    cipher = Cipher(_get_algorithm(key), mode=_MODES[mode](iv))
+    context = cipher.encryptor() if encrypt else cipher.decryptor()
+    return context.update(data) + context.finalize()
+
+
+def _crypt_parallel(data: bytes, key: bytes, mode: str, iv: t.Optional[bytes], *, encrypt: bool) -> bytes:
+    """
+    将数据按数据块边界分段后并行处理，适用于 ECB 模式，以及 CBC / CFB / CFB8 模式的解密
+
+    CBC / CFB / CFB8 解密时每段仅依赖前一段的最后一个密文块，以其作为该段的 iv 即可独立解密。
+
+    :param data: 待处理数据
+    :param key: 密钥
+    :param mode: 加密模式
+    :param iv: 初始化向量，ECB 模式为 None
+    :param encrypt: 是否为加密操作
+    :return: 处理结果
+    """
+    view = memoryview(data)
+    algorithm = _get_algorithm(key)
+
+    def process(bound: t.Tuple[int, int]) -> bytes:
+        start, end = bound
+        segment_iv = iv if start == 0 or mode == 'ecb' else bytes(view[start - 8:start])
+        cipher = Cipher(algorithm, mode=_MODES[mode](segment_iv))
+        context = cipher.encryptor() if encrypt else cipher.decryptor()
+        return context.update(view[start:end]) + context.finalize()
+
+    workers = _parallel.get_workers()
+    return b''.join(_parallel.parallel_map(process, _parallel.split_blocks(len(view), workers, 8), workers))
+
+
+def _crypt_many(
+        items: t.Iterable[t.Tuple[bytes, t.Optional[bytes], bytes]],
+        mode: str,
+        *,
+        encrypt: bool,
+) -> t.List[bytes]:
+    """
+    按加密模式批量完成加解密
+
+    :param items: 由密钥、初始化向量、待处理数据组成的元组列表
+    :param mode: 加密模式
+    :param encrypt: 是否为加密操作
+    :return: 与输入顺序一致的处理结果
+    """
+    if mode not in _MODES:
+        raise ValueError('模式无效，可选值：%s' % ' / '.join(_MODES))
+    items = list(items)
+    if mode == 'ecb':
+        return _CIPHER.crypt_ecb_many(items, lambda data, key: _crypt(data, key, 'ecb', None, encrypt=encrypt))
+    return [_crypt(data, key, mode, iv, encrypt=encrypt) for key, iv, data in items]
+
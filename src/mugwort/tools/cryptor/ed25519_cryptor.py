@@ -17,6 +17,8 @@ from cryptography import exceptions
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ed25519
 
+from . import _parallel
+
 __all__ = [
     'Ed25519Cryptor',
 ]
@@ -49,6 +51,19 @@ class Ed25519Cryptor:
         signature = private_key.sign(message)
         return signature
 
+    @staticmethod
+    def verify_or_raise(public_key: ed25519.Ed25519PublicKey, message: bytes, signature: bytes):
+        """
+        消息校验函数，校验失败时抛出 cryptography.exceptions.InvalidSignature 异常
+
+        注：绝大多数签名均有效的高吞吐场景中，可直接调用本函数并在批次边界统一捕获异常，省去逐次捕获异常的开销。
+
+        :param public_key: 公钥对象
+        :param message: 待校验消息
+        :param signature: 签名信息
+        """
+        public_key.verify(signature, message)
+
     @staticmethod
     def verify(public_key: ed25519.Ed25519PublicKey, message: bytes, signature: bytes) -> bool:
         """
@@ -66,6 +81,37 @@ class Ed25519Cryptor:
         else:
             return True
 
+    @staticmethod
+    def sign_batch(
+            private_key: ed25519.Ed25519PrivateKey,
+            messages: t.Sequence[bytes],
+            workers: t.Optional[int] = None,
+    ) -> t.List[bytes]:
+        """
+        批量消息签名函数，使用线程池并行签名，适用于一次性签名大量消息的场景
+
+        :param private_key: 私钥对象
+        :param messages: 待签名消息列表
+        :param workers: 工人数量，默认为 CPU 核心数
+        :return: 与输入顺序一致的签名信息列表
+        """
+        sign = private_key.sign
+        return _parallel.map_batches(lambda batch: [sign(message) for message in batch], messages, workers)
+
+    @staticmethod
+    def verify_batch(
+            items: t.Sequence[t.Tuple[ed25519.Ed25519PublicKey, bytes, bytes]],
+            workers: t.Optional[int] = None,
+    ) -> t.List[bool]:
+        """
+        批量消息校验函数，使用线程池并行校验，适用于一次性校验大量签名的场景
+
+        :param items: 由公钥对象、待校验消息、签名信息组成的元组列表
+        :param workers: 工人数量，默认为 CPU 核心数
+        :return: 与输入顺序一致的校验结果列表
+        """
+        return _parallel.map_batches(_verify_batch, items, workers)
+
     @staticmethod
     def load_public_key(data: bytes) -> ed25519.Ed25519PublicKey:
         """
@@ -116,3 +162,16 @@ class Ed25519Cryptor:
             encryption_algorithm=serialization.NoEncryption(),
         )
         return private_key_bytes
+
+
+def _verify_batch(items: t.Sequence[t.Tuple[ed25519.Ed25519PublicKey, bytes, bytes]]) -> t.List[bool]:
+    results = []
+    append, invalid_signature = results.append, exceptions.InvalidSignature
+    for public_key, message, signature in items:
+        try:
+            public_key.verify(signature, message)
+        except invalid_signature:
+            append(False)
+        else:
+            append(True)
+    return results
@@ -11,16 +11,40 @@
 @Software    : PyCharm
 @Version     : 1.0.0
 """
+import collections
+import functools
+import threading
 import typing as t
 
 from cryptography import exceptions
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
 
+from . import _parallel
+
 __all__ = [
     'RSACryptor',
 ]
 
+# 填充方案与哈希算法均为不可变对象，在模块级复用以避免每次调用重复构造
+_SHA256 = hashes.SHA256()
+_OAEP = padding.OAEP(mgf=padding.MGF1(algorithm=_SHA256), algorithm=_SHA256, label=None)
+_PSS = padding.PSS(mgf=padding.MGF1(_SHA256), salt_length=padding.PSS.MAX_LENGTH)
+
+# 各编码格式对应的编码方式与装载函数
+_ENCODINGS = {
+    'PEM': serialization.Encoding.PEM,
+    'DER': serialization.Encoding.DER,
+}
+_PUBLIC_KEY_LOADERS = {
+    'PEM': serialization.load_pem_public_key,
+    'DER': serialization.load_der_public_key,
+}
+_PRIVATE_KEY_LOADERS = {
+    'PEM': serialization.load_pem_private_key,
+    'DER': serialization.load_der_private_key,
+}
+
 
 class RSACryptor:
     """
@@ -38,6 +62,22 @@ class RSACryptor:
         private_key = rsa.generate_private_key(65537, key_size)
         return private_key.public_key(), private_key
 
+    @staticmethod
+    def generate_many(
+            count: int,
+            key_size: int = 2048,
+            workers: t.Optional[int] = None,
+    ) -> t.List[t.Tuple[rsa.RSAPublicKey, rsa.RSAPrivateKey]]:
+        """
+        批量密钥对生成函数，使用线程池并行生成，适用于一次性生成大量密钥对的场景
+
+        :param count: 密钥对数量
+        :param key_size: 密钥长度，长度限制：[512, +∞]
+        :param workers: 工人数量，默认为 CPU 核心数
+        :return: 公钥对象、私钥对象组成的列表
+        """
+        return _parallel.parallel_map(lambda _: RSACryptor.generate(key_size), range(count), workers)
+
     @staticmethod
     def encrypt(public_key: rsa.RSAPublicKey, message: bytes) -> bytes:
         """
@@ -49,11 +89,7 @@ class RSACryptor:
         """
         data = public_key.encrypt(
             message,
-            padding.OAEP(
-                mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                algorithm=hashes.SHA256(),
-                label=None,
-            )
+            _OAEP,
         )
         return data
 
@@ -68,11 +104,7 @@ class RSACryptor:
         """
         message = private_key.decrypt(
             message,
-            padding.OAEP(
-                mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                algorithm=hashes.SHA256(),
-                label=None,
-            )
+            _OAEP,
         )
         return message
 
@@ -87,14 +119,24 @@ class RSACryptor:
         """
         signature = private_key.sign(
             message,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH,
-            ),
-            hashes.SHA256(),
+            _PSS,
+            _SHA256,
         )
         return signature
 
+    @staticmethod
+    def verify_or_raise(public_key: rsa.RSAPublicKey, message: bytes, signature: bytes):
+        """
+        消息校验函数，校验失败时抛出 cryptography.exceptions.InvalidSignature 异常
+
+        注：绝大多数签名均有效的高吞吐场景中，可直接调用本函数并在批次边界统一捕获异常，省去逐次捕获异常的开销。
+
+        :param public_key: 公钥对象
+        :param message: 待校验消息
+        :param signature: 签名
+        """
+        public_key.verify(signature, message, _PSS, _SHA256)
+
     @staticmethod
     def verify(public_key: rsa.RSAPublicKey, message: bytes, signature: bytes) -> bool:
         """
@@ -109,11 +151,8 @@ class RSACryptor:
             public_key.verify(
                 signature,
                 message,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH,
-                ),
-                hashes.SHA256(),
+                _PSS,
+                _SHA256,
             )
         except exceptions.InvalidSignature:
             return False
@@ -121,61 +160,207 @@ class RSACryptor:
             return True
 
     @staticmethod
-    def load_public_key(data: bytes) -> rsa.RSAPublicKey:
+    def encrypt_batch(
+            public_key: rsa.RSAPublicKey,
+            messages: t.Sequence[bytes],
+            workers: t.Optional[int] = None,
+    ) -> t.List[bytes]:
+        """
+        批量消息加密函数，使用线程池并行加密，适用于一次性加密大量消息的场景
+
+        :param public_key: 公钥对象
+        :param messages: 明文数据列表
+        :param workers: 工人数量，默认为 CPU 核心数
+        :return: 与输入顺序一致的密文数据列表
+        """
+        encrypt = public_key.encrypt
+        return _parallel.map_batches(lambda batch: [encrypt(message, _OAEP) for message in batch], messages, workers)
+
+    @staticmethod
+    def decrypt_batch(
+            private_key: rsa.RSAPrivateKey,
+            messages: t.Sequence[bytes],
+            workers: t.Optional[int] = None,
+    ) -> t.List[bytes]:
+        """
+        批量消息解密函数，使用线程池并行解密，适用于一次性解密大量消息的场景
+
+        :param private_key: 私钥对象
+        :param messages: 密文数据列表
+        :param workers: 工人数量，默认为 CPU 核心数
+        :return: 与输入顺序一致的明文数据列表
+        """
+        decrypt = private_key.decrypt
+        return _parallel.map_batches(lambda batch: [decrypt(message, _OAEP) for message in batch], messages, workers)
+
+    @staticmethod
+    def sign_batch(
+            private_key: rsa.RSAPrivateKey,
+            messages: t.Sequence[bytes],
+            workers: t.Optional[int] = None,
+    ) -> t.List[bytes]:
+        """
+        批量消息签名函数，使用线程池并行签名，适用于一次性签名大量消息的场景
+
+        :param private_key: 私钥对象
+        :param messages: 待签名消息列表
+        :param workers: 工人数量，默认为 CPU 核心数
+        :return: 与输入顺序一致的签名信息列表
+        """
+        sign = functools.partial(private_key.sign, padding=_PSS, algorithm=_SHA256)
+        return _parallel.map_batches(lambda batch: [sign(message) for message in batch], messages, workers)
+
+    @staticmethod
+    def verify_batch(
+            items: t.Sequence[t.Tuple[rsa.RSAPublicKey, bytes, bytes]],
+            workers: t.Optional[int] = None,
+    ) -> t.List[bool]:
+        """
+        批量消息校验函数，使用线程池并行校验，适用于一次性校验大量签名的场景
+
+        :param items: 由公钥对象、待校验消息、签名信息组成的元组列表
+        :param workers: 工人数量，默认为 CPU 核心数
+        :return: 与输入顺序一致的校验结果列表
+        """
+        return _parallel.map_batches(_verify_batch, items, workers)
+
+    @staticmethod
+    def load_public_key(data: bytes, encoding: str = 'PEM') -> rsa.RSAPublicKey:
         """
         公钥装载函数
 
-        :param data: 公钥文件内容，格式为：PEM
+        :param data: 公钥文件内容
+        :param encoding: 编码格式，可选值：PEM / DER，DER 格式无需 Base64 解码，装载更快
         :return: 公钥对象
         """
-        public_key = serialization.load_pem_public_key(data)
+        _check_encoding(encoding)
+        if isinstance(data, bytes):
+            return _load_public_key_cached(data, encoding)
+        public_key = _PUBLIC_KEY_LOADERS[encoding](data)
         return public_key
 
     @staticmethod
-    def load_private_key(data: bytes, password: t.Optional[bytes] = None) -> rsa.RSAPrivateKey:
+    def load_private_key(data: bytes, password: t.Optional[bytes] = None, encoding: str = 'PEM') -> rsa.RSAPrivateKey:
         """
         私钥装载函数
 
-        :param data: 私钥文件内容，格式为：PEM
+        :param data: 私钥文件内容
         :param password: 私钥密码
+        :param encoding: 编码格式，可选值：PEM / DER，DER 格式无需 Base64 解码，装载更快
         :return: 私钥对象
         """
-        private_key = serialization.load_pem_private_key(data, password)
+        _check_encoding(encoding)
+        # 不缓存私钥的装载结果，避免模块级缓存长期持有私钥对象及其密码
+        private_key = _PRIVATE_KEY_LOADERS[encoding](data, password)
         return private_key
 
     @staticmethod
-    def dump_public_key(public_key: rsa.RSAPublicKey) -> bytes:
+    def dump_public_key(public_key: rsa.RSAPublicKey, encoding: str = 'PEM') -> bytes:
         """
         公钥转储函数
 
         :param public_key: 公钥对象
+        :param encoding: 编码格式，可选值：PEM / DER，DER 格式无需 Base64 编码，转储结果更短
         :return: 公钥文件内容
         """
-        public_key_bytes = public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
+        _check_encoding(encoding)
+        dump_cache = _dump_caches[encoding]
+        public_key_bytes = dump_cache.get(public_key)
+        if public_key_bytes is None:
+            public_key_bytes = public_key.public_bytes(
+                encoding=_ENCODINGS[encoding],
+                format=serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+            dump_cache.put(public_key, public_key_bytes)
         return public_key_bytes
 
     @staticmethod
-    def dump_private_key(private_key: rsa.RSAPrivateKey, password: t.Optional[bytes] = None) -> bytes:
+    def dump_private_key(
+            private_key: rsa.RSAPrivateKey,
+            password: t.Optional[bytes] = None,
+            encoding: str = 'PEM',
+    ) -> bytes:
         """
         私钥转储函数
 
+        注：PEM 格式的无密码私钥沿用 TraditionalOpenSSL 格式，其余情况均使用 PKCS8 格式。
+
         :param private_key: 私钥对象
         :param password: 私钥密码
+        :param encoding: 编码格式，可选值：PEM / DER，DER 格式无需 Base64 编码，转储结果更短
         :return: 私钥文件内容
         """
+        _check_encoding(encoding)
         if password:
             private_key_bytes = private_key.private_bytes(
-                encoding=serialization.Encoding.PEM,
+                encoding=_ENCODINGS[encoding],
                 format=serialization.PrivateFormat.PKCS8,
                 encryption_algorithm=serialization.BestAvailableEncryption(password),
             )
         else:
+            # 不缓存私钥的转储结果，避免模块级缓存长期持有私钥对象及其明文转储内容
+            if encoding == 'PEM':
+                private_format = serialization.PrivateFormat.TraditionalOpenSSL
+            else:
+                private_format = serialization.PrivateFormat.PKCS8
             private_key_bytes = private_key.private_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PrivateFormat.TraditionalOpenSSL,
+                encoding=_ENCODINGS[encoding],
+                format=private_format,
                 encryption_algorithm=serialization.NoEncryption(),
             )
         return private_key_bytes
+
+
+def _verify_batch(items: t.Sequence[t.Tuple[rsa.RSAPublicKey, bytes, bytes]]) -> t.List[bool]:
+    results = []
+    append, invalid_signature = results.append, exceptions.InvalidSignature
+    for public_key, message, signature in items:
+        try:
+            public_key.verify(signature, message, _PSS, _SHA256)
+        except invalid_signature:
+            append(False)
+        else:
+            append(True)
+    return results
+
+
+def _check_encoding(encoding: str):
+    if encoding not in _ENCODINGS:
+        raise ValueError('编码格式无效，可选值：%s' % ' / '.join(_ENCODINGS))
+
+
+@functools.lru_cache(maxsize=256)
+def _load_public_key_cached(data: bytes, encoding: str) -> rsa.RSAPublicKey:
+    return _PUBLIC_KEY_LOADERS[encoding](data)
+
+
+class _DumpCache:
+    """
+    公钥对象到转储结果的 LRU 缓存
+
+    密钥对象不支持弱引用，故以对象 id 为键并持有对象本身，保证缓存期间 id 不会被复用。
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data: 'collections.OrderedDict[int, t.Tuple[t.Any, bytes]]' = collections.OrderedDict()
+
+    def get(self, key: t.Any) -> t.Optional[bytes]:
+        with self._lock:
+            item = self._data.get(id(key))
+            if item is None or item[0] is not key:
+                return None
+            self._data.move_to_end(id(key))
+            return item[1]
+
+    def put(self, key: t.Any, value: bytes):
+        with self._lock:
+            self._data[id(key)] = (key, value)
+            self._data.move_to_end(id(key))
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+
+# 各编码格式的公钥转储结果分别缓存
+_dump_caches = {encoding: _DumpCache() for encoding in _ENCODINGS}
@@ -11,8 +11,7 @@
 @Software    : PyCharm
 @Version     : 1.0.0
 """
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.twofactor import InvalidToken, totp
+import hmac
 
 __all__ = [
     'TOTPCryptor',
@@ -35,11 +34,19 @@ class TOTPCryptor:
         :param time_step: 时间步长，默认 30 秒
         :return: 一次性密码
         """
-        value = totp.TOTP(key, length, hashes.SHA1(), time_step).generate(timestamp)
+        _check_params(key, length, time_step)
+        value = _generate(key, timestamp, length, time_step)
         return value
 
     @staticmethod
-    def verify(key: bytes, value: bytes, timestamp: int, length: int = 6, time_step: int = 30) -> bool:
+    def verify(
+            key: bytes,
+            value: bytes,
+            timestamp: int,
+            length: int = 6,
+            time_step: int = 30,
+            window: int = 0,
+    ) -> bool:
         """
         一次性密码校验函数
 
@@ -48,11 +55,39 @@ class TOTPCryptor:
         :param timestamp: 一次性密码的生成时间，以秒为单位的时间戳
         :param length: 一次性密码的长度，取值限制：[6, 8]
         :param time_step: 时间步长，默认 30 秒
+        :param window: 允许的时间偏差步数，校验 [-window, window] 范围内的全部时间步，默认为 0
         :return: 校验结果
         """
-        try:
-            totp.TOTP(key, length, hashes.SHA1(), time_step).verify(value, timestamp)
-        except InvalidToken:
-            return False
-        else:
-            return True
+        if window < 0:
+            raise ValueError('时间偏差步数无效，取值限制：[0, +∞)')
+        _check_params(key, length, time_step)
+        if not window:
+            return hmac.compare_digest(_generate(key, timestamp, length, time_step), value)
+
+        # 完整比较全部时间步以避免泄露命中位置
+        validity = False
+        for offset in range(-window, window + 1):
+            validity |= hmac.compare_digest(_generate(key, timestamp + offset * time_step, length, time_step), value)
+        return validity
+
+
+def _check_params(key: bytes, length: int, time_step: int):
+    """校验参数，限制与 cryptography 的 TOTP 对象一致"""
+    if len(key) < 16:
+        raise ValueError('密钥长度无效，取值限制：[16, +∞)')
+    if not isinstance(length, int) or not 6 <= length <= 8:
+        raise ValueError('一次性密码的长度无效，取值限制：[6, 8]')
+    if time_step <= 0:
+        raise ValueError('时间步长无效，取值限制：(0, +∞)')
+
+
+def _generate(key: bytes, timestamp: int, length: int, time_step: int) -> bytes:
+    """
+    按 RFC 6238 生成一次性密码，与 cryptography 的 TOTP 对象的结果一致
+
+    注：标准库的一次性 HMAC 接口直接调用 OpenSSL 完成计算，比复制 TOTP 对象中的 HMAC 上下文再计算更快。
+    """
+    digest = hmac.digest(key, int(timestamp / time_step).to_bytes(8, 'big'), 'sha1')
+    offset = digest[-1] & 0x0f
+    code = int.from_bytes(digest[offset:offset + 4], 'big') & 0x7fffffff
+    return b'%0*d' % (length, code % 10 ** length)
@@ -16,6 +16,8 @@ import typing as t
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import x25519
 
+from . import _parallel
+
 __all__ = [
     'X25519Cryptor',
 ]
@@ -48,6 +50,23 @@ class X25519Cryptor:
         shared_key = private_key.exchange(peer_public_key)
         return shared_key
 
+    @staticmethod
+    def exchange_many(
+            private_key: x25519.X25519PrivateKey,
+            peer_public_keys: t.Sequence[x25519.X25519PublicKey],
+            workers: t.Optional[int] = None,
+    ) -> t.List[bytes]:
+        """
+        批量密钥交换函数，使用线程池并行交换，适用于同一私钥与大量对端进行密钥交换的场景
+
+        :param private_key: 私钥对象
+        :param peer_public_keys: 对端公钥对象列表
+        :param workers: 工人数量，默认为 CPU 核心数
+        :return: 与输入顺序一致的共享密钥列表
+        """
+        exchange = private_key.exchange
+        return _parallel.map_batches(lambda batch: [exchange(key) for key in batch], peer_public_keys, workers)
+
     @staticmethod
     def load_public_key(data: bytes) -> x25519.X25519PublicKey:
         """
@@ -11,12 +11,19 @@
 @Software    : PyCharm
 @Version     : 1.0.0
 """
+import asyncio
+import concurrent.futures
+import multiprocessing.shared_memory
+import os
 import time
 import typing as t
+import unittest.mock
 from queue import Queue
 from threading import Lock, RLock, Condition, Semaphore, BoundedSemaphore, Event, Barrier
 
-from mugwort import Logger, MultiTask
+import pytest
+
+from mugwort import Logger, MultiTask, MultiTaskVariable
 
 logger = Logger('Test', level=Logger.INFO, verbose=True)
 
@@ -306,6 +313,17 @@ def test_task_array():
     assert multi_task.submit(task_consumer_array, array).exception() is None
 
 
+def test_task_shared_array():
+    logger.warning('正在实例化 process 模式的多任务类及多任务变量类')
+    multi_task = MultiTask('process', max_workers=2, logger=logger)
+
+    logger.warning('即将测试 process 模式的 shared array')
+    array = multi_task.variable.get_array('i', [1, 2, 3], shared=True)
+    assert multi_task.submit(task_producer_array, array).exception() is None
+    assert multi_task.submit(task_consumer_array, array).exception() is None
+    assert array[:] == [-1, -2, -3]
+
+
 def task_producer_value(obj):
     logger.info('生产者已启动，对象类型: %s', type(obj))
 
@@ -323,6 +341,39 @@ def task_consumer_value(obj):
     logger.info('消费者已退出')
 
 
+def task_worker_shared_ndarray(array: t.Any):
+    matrix = array.ndarray((2, 3))
+    matrix *= 2
+    del matrix
+
+
+def test_task_shared_ndarray():
+    pytest.importorskip('numpy')
+    with MultiTask('process', max_workers=1, logger=logger) as multi_task:
+        array = multi_task.variable.get_array('d', [1, 2, 3, 4, 5, 6], shared=True)
+        assert multi_task.submit(task_worker_shared_ndarray, array).exception() is None
+        matrix = array.ndarray((2, 3))
+        assert matrix.tolist() == [[2, 4, 6], [8, 10, 12]]
+        del matrix
+        array.close()
+
+
+def test_task_shared_array_close_exported():
+    multi_task = MultiTask('process', max_workers=1, logger=logger)
+    array = multi_task.variable.get_array('i', [1, 2, 3], shared=True)
+    name = array._shm.name  # noqa
+    exported = memoryview(array._view)  # noqa
+    with pytest.raises(BufferError):
+        array.close()
+    with pytest.raises(FileNotFoundError):
+        multiprocessing.shared_memory.SharedMemory(name=name)
+    assert exported.tolist() == [1, 2, 3]
+    exported.release()
+    array.close()
+    assert array._view is None  # noqa
+    multi_task.shutdown()
+
+
 def test_task_value():
     logger.warning('正在实例化 process 模式的多任务类及多任务变量类')
     multi_task = MultiTask('process', max_workers=1, logger=logger)
@@ -333,6 +384,17 @@ def test_task_value():
     assert multi_task.submit(task_consumer_value, value).exception() is None
 
 
+def test_task_shared_value():
+    logger.warning('正在实例化 process 模式的多任务类及多任务变量类')
+    multi_task = MultiTask('process', max_workers=1, logger=logger)
+
+    logger.warning('即将测试 process 模式的 shared value')
+    value = multi_task.variable.get_value('i', 123456, shared=True)
+    assert multi_task.submit(task_producer_value, value).exception() is None
+    assert multi_task.submit(task_consumer_value, value).exception() is None
+    assert value.value == -123456
+
+
 def task_producer_dict(obj: t.Dict):
     logger.info('工人已启动，对象类型: %s', type(obj))
 
@@ -389,6 +451,198 @@ def test_task_list():
         assert multi_task.submit(task_consumer_list, list_variable).exception() is None
 
 
+def task_worker_map(value: int) -> int:
+    return value * value
+
+
+def test_task_map():
+    for mode in ['thread', 'process']:
+        logger.warning('正在实例化 %s 模式的多任务类及多任务变量类', mode)
+        multi_task = MultiTask(mode, max_workers=2, logger=logger)
+
+        logger.warning('即将测试 %s 模式的 map', mode)
+        assert list(multi_task.map(task_worker_map, range(8), chunksize=2)) == [i * i for i in range(8)]
+
+        logger.warning('即将测试 %s 模式的 imap', mode)
+        assert list(multi_task.imap(task_worker_map, range(50))) == [i * i for i in range(50)]
+        assert list(multi_task.imap(task_worker_map, iter(range(9)), chunksize=2)) == [i * i for i in range(9)]
+
+
+async def task_worker_asyncio(value: int) -> int:
+    await asyncio.sleep(0.1)
+    return value * value
+
+
+def test_task_asyncio():
+    for bounded in [False, True]:
+        logger.warning('正在实例化 asyncio 模式的多任务类及多任务变量类')
+        multi_task = MultiTask('asyncio', bounded=bounded, max_workers=4, logger=logger)
+
+        logger.warning('即将测试 asyncio 模式的协程函数与普通函数')
+        futures = [multi_task.submit(task_worker_asyncio, i) for i in range(8)]
+        assert [future.result(timeout=30) for future in futures] == [i * i for i in range(8)]
+        assert multi_task.submit(task_worker_map, 3).result(timeout=30) == 9
+        with pytest.raises(ValueError):
+            multi_task.imap(task_worker_asyncio, range(8))
+        multi_task.shutdown()
+
+
+def test_task_asyncio_shutdown_nowait():
+    for bounded in [False, True]:
+        multi_task = MultiTask('asyncio', bounded=bounded, max_workers=2, logger=logger)
+        futures = [multi_task.submit(task_worker_asyncio, 3), multi_task.submit(task_worker_map, 3)]
+        executor = multi_task._executor_pool  # noqa
+        multi_task.shutdown(wait=False)
+        assert [future.result(timeout=30) for future in futures] == [9, 9]
+        executor._closer.join(timeout=30)  # noqa
+        assert not executor._thread.is_alive()  # noqa
+        assert executor.loop.is_closed()
+
+
+async def task_worker_asyncio_shutdown(executor: t.Any, wait: bool):
+    # 在事件循环中另行创建永不结束的任务，关闭时不应等待该任务
+    asyncio.ensure_future(asyncio.sleep(3600))
+    executor.shutdown(wait=wait)
+    return wait
+
+
+def test_task_asyncio_shutdown_in_loop():
+    for wait in [True, False]:
+        multi_task = MultiTask('asyncio', max_workers=2, logger=logger)
+        executor = multi_task._executor_pool  # noqa
+        future = multi_task.submit(task_worker_asyncio_shutdown, executor, wait)
+        if wait:
+            assert isinstance(future.exception(timeout=30), RuntimeError)
+            multi_task.shutdown()
+        else:
+            assert future.result(timeout=30) is False
+            executor._closer.join(timeout=30)  # noqa
+        assert executor.loop.is_closed()
+
+
+def test_task_variable_mode():
+    variable = MultiTaskVariable('thread')
+    assert isinstance(variable, MultiTaskVariable)
+    assert isinstance(variable.get_lock(), type(Lock()))
+    assert isinstance(variable.get_queue(2), Queue)
+    assert variable.get_dict() == {} and variable.get_list([1]) == [1]
+    with pytest.raises(RuntimeError):
+        _ = variable.manager
+    with pytest.raises(RuntimeError):
+        variable.get_namespace()
+
+    with pytest.raises(ValueError):
+        MultiTaskVariable('asyncio')  # noqa
+
+    variable = MultiTaskVariable('process')
+    assert variable._manager is None  # noqa
+    value = variable.get_value('i', 1, shared=True)
+    assert variable._manager is None  # noqa
+    value.close()
+    assert variable.get_dict({'a': 1}).copy() == {'a': 1}
+    assert variable._manager is not None  # noqa
+    variable.close()
+    assert variable._manager is None  # noqa
+
+
+def test_task_context_manager():
+    with MultiTask('thread', max_workers=2, logger=logger) as multi_task:
+        future = multi_task.submit(task_worker_map, 3)
+    assert future.done() and future.result() == 9
+    with pytest.raises(RuntimeError):
+        multi_task.submit(task_worker_map, 3)
+
+
+def task_worker_pid() -> int:
+    return os.getpid()
+
+
+def test_task_reusable():
+    pids = set()
+    for bounded in [False, True]:
+        logger.warning('正在实例化 process 模式的可复用多任务类，有界：%s', bounded)
+        with MultiTask('process', bounded=bounded, reusable=True, max_workers=1, logger=logger) as multi_task:
+            pids.add(multi_task.submit(task_worker_pid).result(timeout=30))
+            assert list(multi_task.map(task_worker_map, range(4), chunksize=2)) == [0, 1, 4, 9]
+    assert len(pids) == 1
+
+    with pytest.raises(ValueError):
+        MultiTask('thread', reusable=True, logger=logger)
+
+
+def test_task_reusable_broken():
+    with MultiTask('process', reusable=True, max_workers=1, logger=logger) as multi_task:
+        with pytest.raises(concurrent.futures.process.BrokenProcessPool):
+            multi_task.submit(os._exit, 1).result(timeout=30)  # noqa
+        assert multi_task.submit(task_worker_map, 3).result(timeout=30) == 9
+        assert list(multi_task.map(task_worker_map, range(4), chunksize=3)) == [0, 1, 4, 9]
+        multi_task._executor_pool._executor.shutdown()  # noqa
+        assert multi_task.submit(task_worker_map, 4).result(timeout=30) == 16
+
+
+def test_task_default_workers():
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+    with MultiTask('process', logger=logger) as multi_task:
+        assert 1 <= multi_task._executor_pool.max_workers <= cpus  # noqa
+    with MultiTask('thread', logger=logger) as multi_task:
+        assert multi_task._executor_pool.max_workers <= min(32, cpus + 4)  # noqa
+
+
+def test_task_submit_multi():
+    with MultiTask('thread', max_workers=2, logger=logger) as multi_task:
+        futures = multi_task.submit_multi(task_worker_map, 3, 2)
+        assert [future.result(timeout=30) for future in futures] == [4, 4, 4]
+        assert multi_task._executor_total == 3  # noqa
+
+
+def test_task_submit_debug_log():
+    for level, logged in [(Logger.INFO, False), (Logger.DEBUG, True)]:
+        submit_logger = Logger('TestSubmit%d' % level, level=level, console=False)
+        with MultiTask('thread', max_workers=1, logger=submit_logger) as multi_task:
+            with unittest.mock.patch.object(submit_logger, 'debug') as debug:
+                assert multi_task.submit(task_worker_map, 2).result(timeout=30) == 4
+            assert debug.called is logged
+
+
+def test_task_shutdown():
+    multi_task = MultiTask('thread', bounded=True, max_workers=1, logger=logger)
+    running = multi_task.submit(time.sleep, 0.5)
+    blocked = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    submitter = blocked.submit(multi_task.submit, time.sleep, 0)
+    time.sleep(0.1)
+    multi_task.shutdown(wait=False)
+    with pytest.raises(RuntimeError):
+        submitter.result(timeout=30)
+    blocked.shutdown()
+    assert running.result(timeout=30) is None
+
+    multi_task = MultiTask('thread', max_workers=1, logger=logger)
+    futures = [multi_task.submit(time.sleep, 0.2) for _ in range(4)]
+    multi_task.shutdown(cancel_futures=True)
+    assert futures[0].done() and not futures[0].cancelled()
+    assert all(future.cancelled() for future in futures[2:])
+
+
+def task_worker_buffer(data: t.Union[bytes, bytearray], *, suffix: bytes) -> t.Tuple[str, int, bytes]:
+    return type(data).__name__, len(data), bytes(data[-1:]) + suffix
+
+
+def test_task_shared_buffer():
+    data = bytes(range(256)) * 8192
+    for bounded in [False, True]:
+        with MultiTask('process', bounded=bounded, max_workers=1, logger=logger) as multi_task:
+            future = multi_task.submit(task_worker_buffer, data, suffix=b'!')
+            assert future.result(timeout=30) == ('bytes', len(data), b'\xff!')
+            future = multi_task.submit(task_worker_buffer, bytearray(data), suffix=bytes(data))
+            assert future.result(timeout=30) == ('bytearray', len(data), b'\xff' + data)
+
+
+def test_task_prestart():
+    with MultiTask('process', prestart=True, max_workers=2, logger=logger) as multi_task:
+        assert len(multi_task._executor_pool._processes) == 2  # noqa
+        assert multi_task.submit(task_worker_map, 3).result(timeout=30) == 9
+
+
 def main():
     logger.warning('=' * 80)
     test_task_lock()